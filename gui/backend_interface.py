@@ -6,149 +6,274 @@ and provides a Python API for sending JSON commands and receiving responses.
 """
 
 import subprocess
+import asyncio
+from array import array
+import collections
+import functools
 import json
+import logging
 import threading
-import queue
+import itertools
 import os
+import selectors
+import struct
 import sys
+import time
+from concurrent.futures import Future, wait as futures_wait
+from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib codec
+    orjson = None
 
-class BackendInterface:
-    """Interface to communicate with the C backend via JSON API"""
+
+log = logging.getLogger(__name__)
+
+
+if orjson is not None:
+    def _dumps(obj):
+        """Encode a command as one newline-terminated JSON line"""
+        return orjson.dumps(obj) + b'\n'
     
-    def __init__(self, executable_path=None):
-        """
-        Initialize the backend interface
-        
-        Args:
-            executable_path: Path to the deadlock.exe executable
-                           If None, will look in ../bin/deadlock.exe
-        """
-        if executable_path is None:
-            # Choose platform-appropriate backend executable name
-            exe_name = 'deadlock.exe' if os.name == 'nt' else 'deadlock'
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        """Encode a command as one newline-terminated JSON line"""
+        return (json.dumps(obj, separators=(',', ':')) + '\n').encode()
+    
+    _loads = json.loads
 
-            if getattr(sys, 'frozen', False):
-                # We are running in a bundle
-                base_path = sys._MEIPASS
-                executable_path = os.path.join(base_path, 'bin', exe_name)
-            else:
-                # Default to bin/deadlock (or deadlock.exe on Windows) relative to project root
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                project_root = os.path.dirname(script_dir)
-                executable_path = os.path.join(project_root, 'bin', exe_name)
-        
-        self.executable_path = executable_path
-        self.process = None
-        self.response_queue = queue.Queue()
-        self.reader_thread = None
-        self.running = False
-        
-    def start(self):
-        """Start the backend process"""
-        if self.running:
-            return
-        
-        if not os.path.exists(self.executable_path):
-            raise FileNotFoundError(f"Backend executable not found: {self.executable_path}")
-        
-        # Start the backend process with --api flag
-        self.process = subprocess.Popen(
-            [self.executable_path, '--api'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
-        )
-        
-        self.running = True
-        
-        # Start reader thread to handle responses
-        self.reader_thread = threading.Thread(target=self._read_responses, daemon=True)
-        self.reader_thread.start()
-        
-    def stop(self):
-        """Stop the backend process"""
-        if not self.running:
-            return
-        
-        try:
-            # Send shutdown command
-            self.send_command({"command": "shutdown"}, wait_response=False)
-        except:
-            pass
+_JSON_BOOL = (b'false', b'true')
+
+# Binary sim_tick frames (see BackendInterface.enable_binary_tick)
+_TICK_FRAME = 0x80
+_TICK_REQUESTS = tuple(bytes((_TICK_FRAME | flags,)) for flags in range(4))
+_TICK_HEADER = struct.Struct('<I')
+_TICK_STATE = struct.Struct('<4?6i')
+
+SimTickState = collections.namedtuple('SimTickState', [
+    'continued', 'running', 'paused', 'deadlock_occurred',
+    'scenario', 'current_tick', 'event_count', 'process_count', 'resource_count',
+    'generation'
+])
+
+
+def _cached(method):
+    """
+    Serve a read-only query from the response cache while the state is unchanged
+    
+    Every backend response carries the state generation ("gen"), which
+    the backend bumps on each mutating command. A cached response is only
+    reused while it was produced at the current generation, so results
+    stored after a concurrent mutation can never be served. Cached
+    responses are shared between callers and must not be modified.
+    
+    Inside a batch() block the cache is bypassed, so every query is
+    queued and the batch responses stay aligned with the commands issued.
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        if self._batch is not None:
+            return method(self, *args)
         
-        self.running = False
+        key = (name, args)
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == self._gen:
+            return hit[1]
         
-        if self.process:
-            try:
-                self.process.stdin.close()
-                self.process.wait(timeout=2)
-            except:
-                self.process.kill()
-            self.process = None
+        response = method(self, *args)
+        if response is not None and response.get('status') == 'success':
+            self._cache[key] = (response.get('gen'), response)
+        return response
     
-    def _read_responses(self):
-        """Background thread to read responses from backend"""
-        while self.running and self.process:
-            try:
-                line = self.process.stdout.readline()
-                if not line:
-                    break
-                
-                # Try to parse as JSON
-                try:
-                    response = json.loads(line.strip())
-                    self.response_queue.put(response)
-                except json.JSONDecodeError:
-                    # Not JSON, might be debug output
-                    pass
-            except Exception as e:
-                if self.running:
-                    self.response_queue.put({"status": "error", "message": str(e)})
-                break
+    return wrapper
+
+
+def default_executable_path():
+    """Locate the backend executable (bundled or ../bin relative to the GUI)"""
+    # Choose platform-appropriate backend executable name
+    exe_name = 'deadlock.exe' if os.name == 'nt' else 'deadlock'
+
+    if getattr(sys, 'frozen', False):
+        # We are running in a bundle
+        return os.path.join(sys._MEIPASS, 'bin', exe_name)
     
-    def send_command(self, command_dict, wait_response=True, timeout=5.0):
+    # Default to bin/deadlock (or deadlock.exe on Windows) relative to project root
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    return os.path.join(project_root, 'bin', exe_name)
+
+
+class _StreamSink:
+    """
+    Collects the lines of a streamed response
+    
+    Registered in the pending map in place of a Future. Record lines put
+    it back under its id so later lines find it; the first non-record
+    line (the final response, or an error) ends the stream.
+    """
+    
+    __slots__ = ('pending', 'request_id', 'records')
+    
+    def __init__(self, pending, request_id):
+        self.pending = pending
+        self.request_id = request_id
+        self.records = collections.deque()
+    
+    def done(self):
+        return False
+    
+    def set_result(self, response):
+        self.records.append(response)
+        if 'record' in response:
+            self.pending[self.request_id] = self
+
+
+class ProcessRecord:
+    """A process from list_processes(), with its fields as attributes"""
+    
+    __slots__ = ('id', 'name', 'priority', 'state', 'active')
+    
+    def __init__(self, id, name, priority, state, active=True):
+        self.id = id
+        self.name = name
+        self.priority = priority
+        self.state = state
+        self.active = active
+
+
+class ResourceRecord:
+    """A resource from list_resources(), with its fields as attributes"""
+    
+    __slots__ = ('id', 'name', 'total_instances', 'available_instances', 'active')
+    
+    def __init__(self, id, name, total_instances, available_instances, active=True):
+        self.id = id
+        self.name = name
+        self.total_instances = total_instances
+        self.available_instances = available_instances
+        self.active = active
+
+
+class ProcessTable:
+    """
+    Column-oriented view of list_processes() data
+    
+    Numeric columns are array('i') so they can be scanned, sorted or
+    filtered without touching a dict per row; iterating yields
+    ProcessRecord rows.
+    """
+    
+    __slots__ = ('ids', 'names', 'priorities', 'states')
+    
+    def __init__(self, rows):
+        self.ids = array('i', [p['id'] for p in rows])
+        self.names = [p['name'] for p in rows]
+        self.priorities = array('i', [p['priority'] for p in rows])
+        self.states = [p['state'] for p in rows]
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __iter__(self):
+        return map(ProcessRecord, self.ids, self.names, self.priorities, self.states)
+
+
+class ResourceTable:
+    """Column-oriented view of list_resources() data (see ProcessTable)"""
+    
+    __slots__ = ('ids', 'names', 'total_instances', 'available_instances')
+    
+    def __init__(self, rows):
+        self.ids = array('i', [r['id'] for r in rows])
+        self.names = [r['name'] for r in rows]
+        self.total_instances = array('i', [r['total_instances'] for r in rows])
+        self.available_instances = array('i', [r['available_instances'] for r in rows])
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __iter__(self):
+        return map(ResourceRecord, self.ids, self.names,
+                   self.total_instances, self.available_instances)
+
+
+class BackendProtocol:
+    """
+    Command helpers and response routing shared by the backend interfaces
+    
+    Subclasses implement send_command(). Helpers return its result
+    directly, so they are plain calls on BackendInterface and awaitables
+    on AsyncBackendInterface.
+    
+    Fixed-shape commands are sent through pre-rendered byte templates
+    (_send_template) rather than building and encoding a dict per call;
+    the final %d slot of every template is the correlation id. Commands
+    with free-form fields (names) still go through send_command().
+    """
+    
+    _TPL_COMMAND = b'{"command":"%s","id":%d}\n'
+    _TPL_PROCESS = b'{"command":"%s","process_id":%d,"id":%d}\n'
+    _TPL_RESOURCE = b'{"command":"%s","resource_id":%d,"id":%d}\n'
+    _TPL_EDGE = b'{"command":"%s","process_id":%d,"resource_id":%d,"id":%d}\n'
+    _TPL_RECOVER = b'{"command":"%s","strategy":%d,"criteria":%d,"id":%d}\n'
+    _TPL_SCENARIO = b'{"command":"sim_load_scenario","scenario":%d,"id":%d}\n'
+    _TPL_SIM_TICK = b'{"command":"sim_tick","auto_detect":%s,"auto_recover":%s,"id":%d}\n'
+    
+    @property
+    def generation(self):
         """
-        Send a command to the backend and optionally wait for response
+        Latest backend state generation seen in a response
         
-        Args:
-            command_dict: Dictionary containing the command and parameters
-            wait_response: Whether to wait for and return the response
-            timeout: Timeout in seconds for waiting for response
-            
-        Returns:
-            Response dictionary if wait_response=True, None otherwise
+        The backend bumps its generation on every state-changing command,
+        so callers can skip re-querying while it is unchanged. Resets to 0
+        when the backend is (re)started.
         """
-        if not self.running or not self.process:
-            raise RuntimeError("Backend not running")
+        return self._gen
+    
+    def _dispatch(self, line):
+        """Parse one response line and hand it to its waiting caller"""
+        # The backend writes the correlation id first; anything else has no
+        # waiter, so skip decoding it. Apart from the startup banner such a
+        # line means the backend lost a request id, and its caller will
+        # time out, so leave a trace of what actually came back
+        if not line.startswith(b'{"id":'):
+            if not line.startswith(b'{"status": "ready"'):
+                log.warning("Dropping backend reply without request id: %r", line)
+            return
         
-        # Send command as JSON
-        json_str = json.dumps(command_dict)
+        # Try to parse as JSON
         try:
-            self.process.stdin.write(json_str + '\n')
-            self.process.stdin.flush()
-        except Exception as e:
-            raise RuntimeError(f"Failed to send command: {e}")
+            response = _loads(line)
+        except ValueError:
+            log.warning("Dropping malformed backend reply: %r", line)
+            return
         
-        if not wait_response:
-            return None
+        self._observe_generation(response.get('gen'))
         
-        # Wait for response - skip any "ready" or non-command responses
-        import time
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        future = self._pending.pop(response['id'], None)
+        if future is not None:
+            if not future.done():
+                future.set_result(response)
+    
+    def _observe_generation(self, gen):
+        """Drop cached query results once the backend state has moved on"""
+        if gen is not None and gen > self._gen:
+            self._gen = gen
+            self._cache.clear()
+    
+    def _fail_pending(self, response):
+        """Complete every outstanding request with the given response"""
+        while self._pending:
             try:
-                response = self.response_queue.get(timeout=0.5)
-                # Skip initialization messages
-                if response.get('status') == 'ready':
-                    continue
-                return response
-            except queue.Empty:
-                continue
-        
-        raise TimeoutError(f"No response received within {timeout} seconds")
+                _, future = self._pending.popitem()
+            except KeyError:
+                break
+            if not future.done():
+                future.set_result(response)
     
     # ============================================================================
     # RAG Operations
@@ -156,15 +281,15 @@ class BackendInterface:
     
     def rag_init(self):
         """Initialize the RAG"""
-        return self.send_command({"command": "rag_init"})
+        return self._send_template(self._TPL_COMMAND, b'rag_init')
     
     def rag_reset(self):
         """Reset the RAG to empty state"""
-        return self.send_command({"command": "rag_reset"})
+        return self._send_template(self._TPL_COMMAND, b'rag_reset')
     
     def rag_get_state(self):
         """Get the current RAG state"""
-        return self.send_command({"command": "rag_get_state"})
+        return self._send_template(self._TPL_COMMAND, b'rag_get_state')
     
     # ============================================================================
     # Process Operations
@@ -180,21 +305,15 @@ class BackendInterface:
     
     def remove_process(self, process_id):
         """Remove a process"""
-        return self.send_command({
-            "command": "remove_process",
-            "process_id": process_id
-        })
+        return self._send_template(self._TPL_PROCESS, b'remove_process', process_id)
     
     def list_processes(self):
         """List all processes"""
-        return self.send_command({"command": "list_processes"})
+        return self._send_template(self._TPL_COMMAND, b'list_processes')
     
     def get_process(self, process_id):
         """Get details of a specific process"""
-        return self.send_command({
-            "command": "get_process",
-            "process_id": process_id
-        })
+        return self._send_template(self._TPL_PROCESS, b'get_process', process_id)
     
     # ============================================================================
     # Resource Operations
@@ -210,21 +329,15 @@ class BackendInterface:
     
     def remove_resource(self, resource_id):
         """Remove a resource"""
-        return self.send_command({
-            "command": "remove_resource",
-            "resource_id": resource_id
-        })
+        return self._send_template(self._TPL_RESOURCE, b'remove_resource', resource_id)
     
     def list_resources(self):
         """List all resources"""
-        return self.send_command({"command": "list_resources"})
+        return self._send_template(self._TPL_COMMAND, b'list_resources')
     
     def get_resource(self, resource_id):
         """Get details of a specific resource"""
-        return self.send_command({
-            "command": "get_resource",
-            "resource_id": resource_id
-        })
+        return self._send_template(self._TPL_RESOURCE, b'get_resource', resource_id)
     
     # ============================================================================
     # Edge Operations
@@ -232,33 +345,40 @@ class BackendInterface:
     
     def request_resource(self, process_id, resource_id):
         """Create a request edge from process to resource"""
-        return self.send_command({
-            "command": "request_resource",
-            "process_id": process_id,
-            "resource_id": resource_id
-        })
+        return self._send_template(self._TPL_EDGE, b'request_resource', process_id, resource_id)
     
     def allocate_resource(self, process_id, resource_id):
         """Allocate resource to process (create assignment edge)"""
-        return self.send_command({
-            "command": "allocate_resource",
-            "process_id": process_id,
-            "resource_id": resource_id
-        })
+        return self._send_template(self._TPL_EDGE, b'allocate_resource', process_id, resource_id)
     
     def release_resource(self, process_id, resource_id):
         """Release resource from process"""
-        return self.send_command({
-            "command": "release_resource",
-            "process_id": process_id,
-            "resource_id": resource_id
-        })
+        return self._send_template(self._TPL_EDGE, b'release_resource', process_id, resource_id)
     
     def release_all(self, process_id):
         """Release all resources held by a process"""
+        return self._send_template(self._TPL_PROCESS, b'release_all', process_id)
+    
+    def bulk_setup(self, processes=(), resources=(), requests=(), allocations=()):
+        """
+        Create processes, resources and edges in a single round trip
+        
+        Args:
+            processes: Iterable of (name, priority) pairs
+            resources: Iterable of (name, instances) pairs
+            requests: Iterable of (process_index, resource_index) pairs
+            allocations: Iterable of (process_index, resource_index) pairs
+            
+        Edge indices refer to positions in processes/resources; the
+        response data lists the created backend ids as process_ids and
+        resource_ids. Allocations are applied before requests.
+        """
         return self.send_command({
-            "command": "release_all",
-            "process_id": process_id
+            "command": "bulk_setup",
+            "processes": [{"name": name, "priority": priority} for name, priority in processes],
+            "resources": [{"name": name, "instances": instances} for name, instances in resources],
+            "requests": [list(edge) for edge in requests],
+            "allocations": [list(edge) for edge in allocations]
         })
     
     # ============================================================================
@@ -267,22 +387,19 @@ class BackendInterface:
     
     def detect_deadlock(self):
         """Detect deadlock in the current RAG"""
-        return self.send_command({"command": "detect_deadlock"})
+        return self._send_template(self._TPL_COMMAND, b'detect_deadlock')
     
     def detect_all_cycles(self):
         """Detect all cycles in the RAG"""
-        return self.send_command({"command": "detect_all_cycles"})
+        return self._send_template(self._TPL_COMMAND, b'detect_all_cycles')
     
     def is_process_deadlocked(self, process_id):
         """Check if a specific process is deadlocked"""
-        return self.send_command({
-            "command": "is_process_deadlocked",
-            "process_id": process_id
-        })
+        return self._send_template(self._TPL_PROCESS, b'is_process_deadlocked', process_id)
     
     def get_wait_for_graph(self):
         """Get the wait-for graph"""
-        return self.send_command({"command": "get_wait_for_graph"})
+        return self._send_template(self._TPL_COMMAND, b'get_wait_for_graph')
     
     # ============================================================================
     # Recovery Operations
@@ -305,15 +422,25 @@ class BackendInterface:
                      2: Fewest Resources
                      3: Youngest Process
         """
-        return self.send_command({
-            "command": "recover",
-            "strategy": strategy,
-            "criteria": criteria
-        })
+        return self._send_template(self._TPL_RECOVER, b'recover', strategy, criteria)
+    
+    def detect_and_recover(self, strategy=1, criteria=1):
+        """
+        Detect deadlock and, if found, recover in a single round trip
+        
+        Args:
+            strategy: Recovery strategy (see recover())
+            criteria: Selection criteria (see recover())
+            
+        Returns:
+            Response whose data holds "detection" and "recovery"
+            (null when there was no deadlock)
+        """
+        return self._send_template(self._TPL_RECOVER, b'detect_and_recover', strategy, criteria)
     
     def recommend_strategy(self):
         """Get recommended recovery strategy"""
-        return self.send_command({"command": "recommend_strategy"})
+        return self._send_template(self._TPL_COMMAND, b'recommend_strategy')
     
     # ============================================================================
     # Simulation Operations
@@ -321,7 +448,7 @@ class BackendInterface:
     
     def sim_init(self):
         """Initialize simulation"""
-        return self.send_command({"command": "sim_init"})
+        return self._send_template(self._TPL_COMMAND, b'sim_init')
     
     def sim_load_scenario(self, scenario):
         """
@@ -334,38 +461,33 @@ class BackendInterface:
                      2: Dining Philosophers
                      3: Random
         """
-        return self.send_command({
-            "command": "sim_load_scenario",
-            "scenario": scenario
-        })
+        return self._send_template(self._TPL_SCENARIO, scenario)
     
     def sim_start(self):
         """Start simulation"""
-        return self.send_command({"command": "sim_start"})
+        return self._send_template(self._TPL_COMMAND, b'sim_start')
     
     def sim_pause(self):
         """Pause simulation"""
-        return self.send_command({"command": "sim_pause"})
+        return self._send_template(self._TPL_COMMAND, b'sim_pause')
     
     def sim_resume(self):
         """Resume simulation"""
-        return self.send_command({"command": "sim_resume"})
+        return self._send_template(self._TPL_COMMAND, b'sim_resume')
     
     def sim_stop(self):
         """Stop simulation"""
-        return self.send_command({"command": "sim_stop"})
+        return self._send_template(self._TPL_COMMAND, b'sim_stop')
     
     def sim_tick(self, auto_detect=False, auto_recover=False):
         """Execute one simulation tick"""
-        return self.send_command({
-            "command": "sim_tick",
-            "auto_detect": auto_detect,
-            "auto_recover": auto_recover
-        })
+        return self._send_template(self._TPL_SIM_TICK,
+                                   _JSON_BOOL[bool(auto_detect)],
+                                   _JSON_BOOL[bool(auto_recover)])
     
     def sim_get_state(self):
         """Get current simulation state"""
-        return self.send_command({"command": "sim_get_state"})
+        return self._send_template(self._TPL_COMMAND, b'sim_get_state')
     
     # ============================================================================
     # System Operations
@@ -373,8 +495,754 @@ class BackendInterface:
     
     def ping(self):
         """Ping the backend to check if it's responsive"""
-        return self.send_command({"command": "ping"})
+        return self._send_template(self._TPL_COMMAND, b'ping')
     
     def get_version(self):
         """Get backend API version"""
-        return self.send_command({"command": "get_version"})
+        return self._send_template(self._TPL_COMMAND, b'get_version')
+
+
+class BackendInterface(BackendProtocol):
+    """
+    Interface to communicate with the C backend via JSON API
+    
+    Safe to share between threads: writes are serialized by a lock and
+    responses are matched to callers by request id, so concurrent
+    commands pipeline over the one pipe. batch() blocks are per-thread.
+    
+    On POSIX there is no reader thread: whichever caller is waiting for a
+    response drives a selector on the backend's stdout and dispatches every
+    complete line it reads, resolving other callers' futures along the way.
+    Only one caller pumps at a time; the rest sleep on a condition that is
+    signalled after each read. Windows cannot select() on pipes, so there
+    a background thread reads responses instead.
+    """
+    
+    def __init__(self, executable_path=None):
+        """
+        Initialize the backend interface
+        
+        Args:
+            executable_path: Path to the deadlock.exe executable
+                           If None, will look in ../bin/deadlock.exe
+        """
+        self.executable_path = executable_path or default_executable_path()
+        self.process = None
+        self._stdin_fd = None
+        self._stdout_fd = None
+        self._selector = None
+        self.reader_thread = None
+        self.running = False
+        
+        # Unparsed tail of the response stream
+        self._rbuf = bytearray()
+        
+        # Read buffer allocated once; reads land here instead of in new bytes objects
+        self._rchunk = memoryview(bytearray(65536))
+        
+        # Leader/follower coordination for pumping the selector
+        self._io_cond = threading.Condition()
+        self._pumping = False
+        
+        # Request correlation: id -> Future (dict ops are atomic under the GIL)
+        self._pending = {}
+        self._id_counter = itertools.count(1)
+        
+        # Query cache: (method, args) -> (generation, response)
+        self._gen = 0
+        self._cache = {}
+        
+        # Serializes stdin writes so concurrent callers never interleave frames
+        self._write_lock = threading.Lock()
+        
+        # Per-thread state; holds the frames of an active batch() block
+        self._local = threading.local()
+        
+        # Binary sim_tick mode; tick replies carry no id and arrive in order
+        self._binary_tick = False
+        self._tick_waiters = collections.deque()
+        
+    def start(self):
+        """Start the backend process"""
+        if self.running:
+            return
+        
+        if not os.path.exists(self.executable_path):
+            raise FileNotFoundError(f"Backend executable not found: {self.executable_path}")
+        
+        # Start the backend process with --api flag
+        self.process = subprocess.Popen(
+            [self.executable_path, '--api'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Nothing reads stderr; a PIPE could fill and stall the backend
+            bufsize=0
+        )
+        self._stdin_fd = self.process.stdin.fileno()
+        self._stdout_fd = self.process.stdout.fileno()
+        self._rbuf.clear()
+        self._binary_tick = False
+        self._gen = 0
+        self._cache.clear()
+        
+        self.running = True
+        
+        if os.name == 'nt':
+            # Start reader thread to handle responses
+            self.reader_thread = threading.Thread(target=self._read_responses, daemon=True)
+            self.reader_thread.start()
+        else:
+            # Non-blocking stdin lets a large write drain responses when the pipe fills
+            os.set_blocking(self._stdin_fd, False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._stdout_fd, selectors.EVENT_READ)
+        
+    def stop(self):
+        """Stop the backend process"""
+        if not self.running:
+            return
+        
+        try:
+            # Send shutdown command
+            self.send_command({"command": "shutdown"}, wait_response=False)
+        except:
+            pass
+        
+        self.running = False
+        
+        if self.process:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2)
+            except:
+                self.process.kill()
+            self.process = None
+        
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+    
+    def _read_chunk(self):
+        """Read available backend output into the preallocated buffer"""
+        return self._rchunk[:self.process.stdout.readinto(self._rchunk)]
+    
+    def _feed(self, chunk):
+        """
+        Consume a chunk of backend output
+        
+        Returns:
+            False once the backend has closed its stdout, True otherwise
+        """
+        if not chunk:
+            # Backend exited; don't leave callers waiting for a timeout
+            self._fail_pending({"status": "error", "message": "Backend process exited"})
+            return False
+        
+        buf = self._rbuf
+        buf += chunk
+        
+        # Split off every complete line; bytes.find is a C-level scan
+        start = 0
+        while True:
+            if buf[start:start + 1] == b'\x80':
+                # Length-prefixed binary tick frame
+                body = start + 1 + _TICK_HEADER.size
+                if len(buf) < body:
+                    break
+                end = body + _TICK_HEADER.unpack_from(buf, start + 1)[0]
+                if len(buf) < end:
+                    break
+                self._dispatch_tick(bytes(buf[body:end]))
+                start = end
+                continue
+            
+            newline = buf.find(b'\n', start)
+            if newline == -1:
+                break
+            self._dispatch(bytes(buf[start:newline]))
+            start = newline + 1
+        del buf[:start]
+        return True
+    
+    def _dispatch_tick(self, body):
+        """Resolve the oldest outstanding binary tick with its state"""
+        try:
+            future = self._tick_waiters.popleft()
+        except IndexError:
+            return
+        state = SimTickState._make(_TICK_STATE.unpack_from(body))
+        self._observe_generation(state.generation)
+        if not future.done():
+            future.set_result({
+                "status": "success",
+                "message": "Tick executed" if state.continued else "Simulation ended",
+                "data": state._asdict()
+            })
+    
+    def _fail_pending(self, response):
+        """Complete every outstanding request, binary ticks included"""
+        super()._fail_pending(response)
+        while self._tick_waiters:
+            try:
+                future = self._tick_waiters.popleft()
+            except IndexError:
+                break
+            if not future.done():
+                future.set_result(response)
+    
+    def _read_responses(self):
+        """Background thread to read responses from backend (Windows only)"""
+        alive = True
+        while self.running and alive:
+            try:
+                alive = self._feed(self._read_chunk())
+            except Exception as e:
+                if self.running:
+                    self._fail_pending({"status": "error", "message": str(e)})
+                alive = False
+            # Wake stream consumers waiting in _wait_until()
+            with self._io_cond:
+                self._io_cond.notify_all()
+    
+    def _pump(self, timeout):
+        """
+        Read and dispatch whatever the backend has written, waiting up to timeout
+        
+        Only one thread pumps at a time; a caller that finds the selector
+        busy sleeps until the current pump round finishes instead.
+        """
+        with self._io_cond:
+            if self._pumping:
+                self._io_cond.wait(timeout)
+                return
+            self._pumping = True
+        
+        try:
+            selector = self._selector
+            if selector is not None and selector.select(timeout):
+                self._feed(self._read_chunk())
+        except Exception as e:
+            if self.running:
+                self._fail_pending({"status": "error", "message": str(e)})
+        finally:
+            with self._io_cond:
+                self._pumping = False
+                self._io_cond.notify_all()
+    
+    def _register(self, request_id):
+        """Create the response future for a correlation id"""
+        future = Future()
+        self._pending[request_id] = future
+        return future
+    
+    def _collect(self, request_id, future, timeout):
+        """
+        Block until the response for a registered command arrives
+        
+        Returns:
+            The response dictionary, or None on timeout
+        """
+        if not future.done():
+            if self._selector is not None:
+                deadline = time.monotonic() + timeout
+                while not future.done():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._pending.pop(request_id, None)
+                        return None
+                    self._pump(remaining)
+            elif not futures_wait((future,), timeout).done:
+                self._pending.pop(request_id, None)
+                return None
+        return future.result()
+    
+    def _wait(self, request_id, future, timeout):
+        """Like _collect(), but raise TimeoutError instead of returning None"""
+        response = self._collect(request_id, future, timeout)
+        if response is None:
+            raise TimeoutError(f"No response received within {timeout} seconds")
+        return response
+    
+    def _wait_until(self, ready, timeout):
+        """
+        Block until ready() returns true
+        
+        Returns:
+            False if timeout expired first, True otherwise
+        """
+        if self._selector is None:
+            with self._io_cond:
+                return self._io_cond.wait_for(ready, timeout)
+        
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._pump(remaining)
+        return True
+    
+    @property
+    def _batch(self):
+        """Frames collected by this thread's active batch() block, if any"""
+        return getattr(self._local, 'batch', None)
+    
+    def _write(self, payload):
+        """Write encoded JSON lines to the backend"""
+        with self._write_lock:
+            self._write_locked(payload)
+    
+    def _write_locked(self, payload):
+        """Write to the backend; the caller must hold _write_lock"""
+        try:
+            # Pipe writes may be partial; loop until drained
+            view = memoryview(payload)
+            while view:
+                try:
+                    view = view[os.write(self._stdin_fd, view):]
+                except BlockingIOError:
+                    # The backend may be stalled on a full stdout; drain it
+                    self._pump(0.01)
+        except Exception as e:
+            raise RuntimeError(f"Failed to send command: {e}")
+    
+    def _submit(self, request_id, frame, timeout):
+        """
+        Send one encoded request frame and wait for its response
+        
+        Inside a batch() block the frame is queued instead and None is
+        returned; its response is delivered when the block exits.
+        """
+        if self._batch is not None:
+            self._batch.append((request_id, frame))
+            return None
+        
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        future = self._register(request_id)
+        try:
+            self._write(frame)
+        except RuntimeError:
+            self._pending.pop(request_id, None)
+            raise
+        return self._wait(request_id, future, timeout)
+    
+    def _submit_noexc(self, request_id, frame, timeout):
+        """
+        Send one encoded request frame without raising on failure
+        
+        Returns:
+            Tuple of (ok, response); (False, None) if the backend is not
+            running, could not be written to or did not answer in time
+        """
+        if self._batch is not None:
+            self._batch.append((request_id, frame))
+            return True, None
+        
+        if not self.running or not self.process:
+            return False, None
+        
+        future = self._register(request_id)
+        try:
+            self._write(frame)
+        except RuntimeError:
+            self._pending.pop(request_id, None)
+            return False, None
+        response = self._collect(request_id, future, timeout)
+        return response is not None, response
+    
+    def _send_template(self, template, *args, timeout=5.0):
+        """Fill a pre-rendered command template and send it"""
+        request_id = next(self._id_counter)
+        return self._submit(request_id, template % (*args, request_id), timeout)
+    
+    def _send_template_noexc(self, template, *args, timeout=5.0):
+        """Fill a pre-rendered command template and send it without raising"""
+        request_id = next(self._id_counter)
+        return self._submit_noexc(request_id, template % (*args, request_id), timeout)
+    
+    def send_command_noexc(self, command_dict, timeout=5.0):
+        """
+        Send a command and wait for its response without raising
+        
+        Meant for high-frequency calls (polling, ticks) where a timeout or
+        a stopped backend is an expected outcome, so the failure path
+        should not pay for building an exception and its traceback.
+        
+        Args:
+            command_dict: Dictionary containing the command and parameters
+            timeout: Timeout in seconds for waiting for response
+            
+        Returns:
+            (True, response) on success, (False, None) otherwise
+        """
+        request_id = next(self._id_counter)
+        return self._submit_noexc(request_id, _dumps(dict(command_dict, id=request_id)), timeout)
+    
+    def send_command(self, command_dict, wait_response=True, timeout=5.0):
+        """
+        Send a command to the backend and optionally wait for response
+        
+        Inside a batch() block the command is queued instead and None is
+        returned; its response is delivered when the block exits.
+        
+        Args:
+            command_dict: Dictionary containing the command and parameters
+            wait_response: Whether to wait for and return the response
+            timeout: Timeout in seconds for waiting for response
+            
+        Returns:
+            Response dictionary if wait_response=True, None otherwise
+        """
+        if wait_response or self._batch is not None:
+            request_id = next(self._id_counter)
+            return self._submit(request_id, _dumps(dict(command_dict, id=request_id)), timeout)
+        
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        self._write(_dumps(command_dict))
+        return None
+    
+    def send_batch(self, commands, timeout=5.0):
+        """
+        Send several commands in a single write and collect their responses
+        
+        Args:
+            commands: List of command dictionaries
+            timeout: Timeout in seconds for each response
+            
+        Returns:
+            List of response dictionaries, in the same order as commands
+        """
+        frames = []
+        for command in commands:
+            request_id = next(self._id_counter)
+            frames.append((request_id, _dumps(dict(command, id=request_id))))
+        return self._send_frames(frames, timeout)
+    
+    def _send_frames(self, frames, timeout):
+        """Write (request_id, frame) pairs in one go and collect responses"""
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        futures = [(request_id, self._register(request_id)) for request_id, _ in frames]
+        self._write(b''.join(frame for _, frame in frames))
+        return [self._wait(request_id, future, timeout) for request_id, future in futures]
+    
+    rag_get_state = _cached(BackendProtocol.rag_get_state)
+    list_processes = _cached(BackendProtocol.list_processes)
+    get_process = _cached(BackendProtocol.get_process)
+    list_resources = _cached(BackendProtocol.list_resources)
+    get_resource = _cached(BackendProtocol.get_resource)
+    get_wait_for_graph = _cached(BackendProtocol.get_wait_for_graph)
+    # Detection and strategy queries are read-only on the backend too, so
+    # repeating them on an unchanged graph costs no round-trip
+    detect_deadlock = _cached(BackendProtocol.detect_deadlock)
+    detect_all_cycles = _cached(BackendProtocol.detect_all_cycles)
+    is_process_deadlocked = _cached(BackendProtocol.is_process_deadlocked)
+    recommend_strategy = _cached(BackendProtocol.recommend_strategy)
+    
+    def _table(self, response, table_type):
+        """Build (or reuse) a column table for a cached list response"""
+        if not response or response.get('status') != 'success':
+            return None
+        
+        key = (table_type.__name__, ())
+        gen = response.get('gen')
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == gen:
+            return hit[1]
+        
+        table = table_type(response.get('data') or [])
+        self._cache[key] = (gen, table)
+        return table
+    
+    def process_table(self):
+        """
+        List all processes as a ProcessTable
+        
+        Returns:
+            ProcessTable, or None if the query failed
+        """
+        return self._table(self.list_processes(), ProcessTable)
+    
+    def resource_table(self):
+        """
+        List all resources as a ResourceTable
+        
+        Returns:
+            ResourceTable, or None if the query failed
+        """
+        return self._table(self.list_resources(), ResourceTable)
+    
+    def enable_binary_tick(self):
+        """
+        Switch sim_tick to the backend's binary frame format
+        
+        Each tick then costs a single flag byte out and a fixed-size struct
+        back instead of a JSON round trip. The response keeps the usual
+        shape, except data['scenario'] is the scenario number rather than
+        its name.
+        
+        Returns:
+            True if the backend accepted; otherwise sim_tick stays on JSON
+        """
+        response = self.send_command({"command": "set_tick_mode", "mode": "binary"})
+        self._binary_tick = bool(response) and response.get('status') == 'success'
+        return self._binary_tick
+    
+    def stream_command(self, command_dict, timeout=5.0):
+        """
+        Send a command whose response is streamed as several lines
+        
+        The backend answers with any number of record lines
+        ({"record": kind, "data": ...}) followed by a final response
+        carrying "end": true. The command is sent immediately; the
+        returned iterator yields every line as it arrives, the final
+        response last.
+        
+        Args:
+            command_dict: Dictionary containing the command and parameters
+            timeout: Timeout in seconds for each line
+            
+        Returns:
+            Iterator over response dictionaries
+        """
+        if self._batch is not None:
+            raise RuntimeError("stream_command() cannot be used inside batch()")
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        request_id = next(self._id_counter)
+        sink = _StreamSink(self._pending, request_id)
+        self._pending[request_id] = sink
+        try:
+            self._write(_dumps(dict(command_dict, id=request_id)))
+        except RuntimeError:
+            self._pending.pop(request_id, None)
+            raise
+        return self._iter_stream(sink, timeout)
+    
+    def _iter_stream(self, sink, timeout):
+        """Yield the lines collected by a stream sink until its final response"""
+        records = sink.records
+        try:
+            while True:
+                if not records and not self._wait_until(lambda: records, timeout):
+                    raise TimeoutError(f"No response received within {timeout} seconds")
+                response = records.popleft()
+                yield response
+                if 'record' not in response:
+                    return
+        finally:
+            self._pending.pop(sink.request_id, None)
+    
+    def sim_load_scenario(self, scenario, stream=False):
+        """
+        Load a simulation scenario
+        
+        Args:
+            scenario: Scenario number (see BackendProtocol.sim_load_scenario)
+            stream: If True, return an iterator over the loaded graph as
+                    process/resource/assignment/request records, ending
+                    with the usual response (see stream_command())
+        """
+        if not stream:
+            return super().sim_load_scenario(scenario)
+        return self.stream_command({
+            "command": "sim_load_scenario",
+            "scenario": scenario,
+            "stream": True
+        })
+    
+    def sim_tick(self, auto_detect=False, auto_recover=False):
+        """
+        Execute one simulation tick
+        
+        Returns:
+            Response dictionary, or None if the backend is not running or
+            did not answer in time (ticks are polled, so this never raises)
+        """
+        if not self._binary_tick or self._batch is not None:
+            return self._send_template_noexc(self._TPL_SIM_TICK,
+                                             _JSON_BOOL[bool(auto_detect)],
+                                             _JSON_BOOL[bool(auto_recover)])[1]
+        
+        if not self.running or not self.process:
+            return None
+        
+        future = Future()
+        # Tick replies are matched by order, so queue and write atomically
+        with self._write_lock:
+            self._tick_waiters.append(future)
+            try:
+                self._write_locked(_TICK_REQUESTS[bool(auto_detect) | bool(auto_recover) << 1])
+            except RuntimeError:
+                self._tick_waiters.remove(future)
+                return None
+        return self._collect(None, future, 5.0)
+    
+    def ping(self):
+        """
+        Ping the backend to check if it's responsive
+        
+        Returns:
+            Response dictionary, or None if the backend is not responsive
+        """
+        return self._send_template_noexc(self._TPL_COMMAND, b'ping')[1]
+    
+    @contextmanager
+    def batch(self, timeout=5.0):
+        """
+        Collect commands issued inside the block and send them as one batch
+        
+        Usage:
+            with backend.batch() as responses:
+                backend.add_process("A")
+                backend.add_resource("R1")
+            # responses now holds one response per command
+        """
+        frames = []
+        responses = []
+        self._local.batch = frames
+        try:
+            yield responses
+        finally:
+            self._local.batch = None
+        if frames:
+            responses.extend(self._send_frames(frames, timeout))
+
+
+class AsyncBackendInterface(BackendProtocol):
+    """
+    Asyncio interface to the C backend
+    
+    Every command helper is a coroutine, so independent requests can be
+    pipelined with asyncio.gather() over a single pipe:
+    
+        await backend.start()
+        results = await asyncio.gather(*(backend.get_process(i) for i in ids))
+    """
+    
+    def __init__(self, executable_path=None):
+        """
+        Initialize the async backend interface
+        
+        Args:
+            executable_path: Path to the deadlock.exe executable
+                           If None, will look in ../bin/deadlock.exe
+        """
+        self.executable_path = executable_path or default_executable_path()
+        self.process = None
+        self.reader_task = None
+        self.running = False
+        
+        # Request correlation: id -> asyncio.Future
+        self._pending = {}
+        self._id_counter = itertools.count(1)
+        
+        # Last seen state generation; nothing is cached on this interface
+        self._gen = 0
+        self._cache = {}
+        
+    async def start(self):
+        """Start the backend process"""
+        if self.running:
+            return
+        
+        if not os.path.exists(self.executable_path):
+            raise FileNotFoundError(f"Backend executable not found: {self.executable_path}")
+        
+        self.process = await asyncio.create_subprocess_exec(
+            self.executable_path, '--api',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=1 << 20  # Large state dumps exceed the default 64 KiB line limit
+        )
+        
+        self.running = True
+        self.reader_task = asyncio.ensure_future(self._read_responses())
+        
+    async def stop(self):
+        """Stop the backend process"""
+        if not self.running:
+            return
+        
+        try:
+            await self.send_command({"command": "shutdown"}, wait_response=False)
+        except Exception:
+            pass
+        
+        self.running = False
+        
+        if self.process:
+            try:
+                self.process.stdin.close()
+                await asyncio.wait_for(self.process.wait(), timeout=2)
+            except Exception:
+                self.process.kill()
+            self.process = None
+        
+        if self.reader_task:
+            self.reader_task.cancel()
+            self.reader_task = None
+    
+    async def _read_responses(self):
+        """Reader coroutine: resolve pending futures as responses arrive"""
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+                self._dispatch(line)
+        except Exception as e:
+            self._fail_pending({"status": "error", "message": str(e)})
+            return
+        self._fail_pending({"status": "error", "message": "Backend process exited"})
+    
+    async def send_command(self, command_dict, wait_response=True, timeout=5.0):
+        """
+        Send a command to the backend and optionally await its response
+        
+        Args:
+            command_dict: Dictionary containing the command and parameters
+            wait_response: Whether to wait for and return the response
+            timeout: Timeout in seconds for waiting for response
+            
+        Returns:
+            Response dictionary if wait_response=True, None otherwise
+        """
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        if not wait_response:
+            self.process.stdin.write(_dumps(command_dict))
+            await self.process.stdin.drain()
+            return None
+        
+        request_id = next(self._id_counter)
+        return await self._submit(request_id, _dumps(dict(command_dict, id=request_id)), timeout)
+    
+    async def _send_template(self, template, *args, timeout=5.0):
+        """Fill a pre-rendered command template and send it"""
+        request_id = next(self._id_counter)
+        return await self._submit(request_id, template % (*args, request_id), timeout)
+    
+    async def _submit(self, request_id, frame, timeout):
+        """Send one encoded request frame and await its response"""
+        if not self.running or not self.process:
+            raise RuntimeError("Backend not running")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self.process.stdin.write(frame)
+            await self.process.stdin.drain()
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No response received within {timeout} seconds")
+        finally:
+            self._pending.pop(request_id, None)
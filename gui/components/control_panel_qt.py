@@ -4,19 +4,173 @@ Control Panel Component (PyQt6)
 Provides interface for managing processes, resources, and edges.
 """
 
+import functools
+import logging
+import sys
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QGroupBox,
-    QLabel, QLineEdit, QSpinBox, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QFrame, QSizePolicy
+    QLabel, QLineEdit, QSpinBox, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QMessageBox, QFrame, QSizePolicy,
+    QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtCore import (
+    QAbstractTableModel, QModelIndex, QRegularExpression, Qt, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QRegularExpressionValidator
 
 from utils.theme_qt import COLORS, get_font
+from utils.qt_utils import async_handler, bulk_update, run_blocking
+
+
+log = logging.getLogger(__name__)
+
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+
+# Model data role holding the process/resource id of a row
+_ID_ROLE = Qt.ItemDataRole.UserRole
+
+# Names the backend stores verbatim: at most MAX_NAME_LENGTH - 1 (31)
+# characters, with no quotes, backslashes or control characters
+_NAME_MAX_LENGTH = 31
+_NAME_PATTERN = QRegularExpression(r'[^"\\\x00-\x1f]*')
+
+# Errors a list refresh can expect: backend I/O failures (RuntimeError,
+# TimeoutError) and malformed payloads. Anything else is a bug and is
+# left to the async handler's error report
+_REFRESH_ERRORS = (RuntimeError, TimeoutError, KeyError, TypeError, ValueError)
+
+# Display text for ids and counts; the same few numbers recur every refresh
+_int_text = functools.lru_cache(maxsize=2048)(str)
+
+# Display text for the process states the backend reports; interned so
+# every row in a given state shares one string object
+_STATE_UPPER = {state: sys.intern(state.upper())
+                for state in ('running', 'waiting', 'blocked', 'terminated', 'unknown')}
+
+
+class RowTableModel(QAbstractTableModel):
+    """
+    Table model over rows of display strings keyed by record id
+    
+    Views only ask for the cells they paint, so no per-cell objects are
+    created and a refresh costs a swap of the row dict.
+    """
+    
+    def __init__(self, headers, parent=None):
+        """
+        Initialize the model
+        
+        Args:
+            headers: Column titles
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._headers = headers
+        self._keys = []
+        self._rows = {}
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+        
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            return self._rows[self._keys[index.row()]][index.column()]
+        if role == _ALIGNMENT_ROLE:
+            return _ALIGN_CENTER
+        if role == _ID_ROLE:
+            return self._keys[index.row()]
+        return None
+        
+    def cell(self, row, column):
+        """Return the display text of a cell without going through data()"""
+        return self._rows[self._keys[row]][column]
+        
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if orientation == Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
+            return self._headers[section]
+        return None
+        
+    def set_rows(self, rows):
+        """
+        Update the model to new rows, signalling only what changed
+        
+        Removed ids are dropped, changed rows emit dataChanged and new ids
+        are appended, so views keep their selection and scroll position.
+        A first load or a mostly replaced list resets the model instead.
+        
+        Args:
+            rows: Dict of id -> tuple of display strings, in display order
+        """
+        old = self._rows
+        keys = self._keys
+        
+        # First load, or most rows gone: one reset sizes the view in a
+        # single step instead of signalling many small removals/inserts
+        stale = sum(1 for key in keys if key not in rows)
+        if not keys or stale * 2 > len(keys):
+            self.beginResetModel()
+            self._keys = list(rows)
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        # Drop vanished ids, one contiguous run at a time (bottom-up
+        # keeps the remaining indices valid)
+        row = len(keys) - 1
+        while row >= 0:
+            if keys[row] in rows:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and keys[row] not in rows:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del keys[row + 1:last + 1]
+            self.endRemoveRows()
+            
+        # Repaint rows whose values changed; unchanged rows keep their
+        # existing tuple so the new one is freed right away
+        self._rows = rows
+        last_column = len(self._headers) - 1
+        for row, key in enumerate(keys):
+            values = old[key]
+            if rows[key] == values:
+                rows[key] = values
+            else:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+                
+        # Append new ids
+        added = [key for key in rows if key not in old]
+        if added:
+            first = len(keys)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            keys.extend(added)
+            self.endInsertRows()
+
+
+class RowDelegate(QStyledItemDelegate):
+    """
+    Item delegate that styles RowTableModel cells from a single lookup
+    
+    The default initStyleOption() asks the model for every role it knows
+    (font, alignment, colors, check state, icon, ...) on each paint and
+    size hint. Every cell here is centred plain text, so the text is the
+    only thing fetched.
+    """
+    
+    _HAS_DISPLAY = QStyleOptionViewItem.ViewItemFeature.HasDisplay
+    
+    def initStyleOption(self, option, index):
+        option.index = index
+        option.text = index.model().cell(index.row(), index.column())
+        option.displayAlignment = _ALIGN_CENTER
+        option.features |= self._HAS_DISPLAY
 
 
 class ControlPanel(QWidget):
@@ -27,6 +181,28 @@ class ControlPanel(QWidget):
     def __init__(self, backend, parent=None):
         super().__init__(parent)
         self.backend = backend
+        
+        # Table models; views are created with their tabs
+        self.process_model = RowTableModel(["ID", "Name", "Priority", "State"], self)
+        self.resource_model = RowTableModel(["ID", "Name", "Total", "Available"], self)
+        self.resource_table = None  # Built with its tab on first view
+        
+        # Last list payloads applied, so unchanged polls return early
+        self._last_process_payload = None
+        self._last_resource_payload = None
+        
+        # Backend state generation each table was last loaded at; while the
+        # backend reports the same generation the lists cannot have changed
+        self._process_gen = None
+        self._resource_gen = None
+        
+        # Coalesces refresh/updated notifications; each restart pushes the
+        # deadline out, so a burst of operations fires once after it ends
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(25)
+        self._update_timer.timeout.connect(self._flush_update)
+        
         self._setup_ui()
         
     def _setup_ui(self):
@@ -44,156 +220,199 @@ class ControlPanel(QWidget):
         process_tab = self._create_process_tab()
         self.tabs.addTab(process_tab, "Processes")
         
-        # Resource tab
-        resource_tab = self._create_resource_tab()
-        self.tabs.addTab(resource_tab, "Resources")
-        
-        # Edge tab
-        edge_tab = self._create_edge_tab()
-        self.tabs.addTab(edge_tab, "Edges")
+        # Resource and edge tabs are built the first time they are shown
+        self._tab_builders = {}
+        for title, builder in (("Resources", self._create_resource_tab),
+                               ("Edges", self._create_edge_tab)):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            index = self.tabs.addTab(placeholder, title)
+            self._tab_builders[index] = builder
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        
+        # Non-modal status line for confirmations and input hints
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet(f"color: {COLORS['text_muted']}; padding: 6px 4px 0 4px;")
+        layout.addWidget(self.status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self.status_label.clear)
+        
+    def _on_tab_changed(self, index):
+        """Build a deferred tab the first time it is selected, then refresh it"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+        self.refresh()
         
     def _create_process_tab(self):
         """Create process management tab"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        # Layouts are filled before being installed, so geometry is
+        # computed once per container instead of after every addWidget
+        layout = QVBoxLayout()
         layout.setSpacing(12)
         layout.setContentsMargins(8, 12, 8, 8)
         
         # Add Process section
-        add_group = QGroupBox("Add Process")
-        add_layout = QVBoxLayout(add_group)
-        add_layout.setSpacing(12)
-        
-        # Name row
-        name_row = QHBoxLayout()
-        name_row.setSpacing(12)
-        name_label = QLabel("Name")
-        name_label.setFixedWidth(60)
-        name_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.process_name_input = QLineEdit()
-        self.process_name_input.setPlaceholderText("Enter process name...")
-        name_row.addWidget(name_label)
-        name_row.addWidget(self.process_name_input)
-        add_layout.addLayout(name_row)
-        
-        # Priority row
-        priority_row = QHBoxLayout()
-        priority_row.setSpacing(12)
-        priority_label = QLabel("Priority")
-        priority_label.setFixedWidth(60)
-        priority_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.process_priority_input = QSpinBox()
-        self.process_priority_input.setRange(0, 100)
-        self.process_priority_input.setValue(50)
-        self.process_priority_input.setFixedWidth(100)
-        priority_row.addWidget(priority_label)
-        priority_row.addWidget(self.process_priority_input)
-        priority_row.addStretch()
-        add_layout.addLayout(priority_row)
-        
-        # Add button
+        self.process_name_input = self._make_name_input("Enter process name...")
+        self.process_priority_input = self._make_spin(0, 100, 50)
         add_btn = QPushButton("Add Process")
         add_btn.clicked.connect(self._add_process)
-        add_layout.addWidget(add_btn)
-        
-        layout.addWidget(add_group)
+        layout.addWidget(self._make_form("Add Process", [
+            ("Name", self.process_name_input),
+            ("Priority", self.process_priority_input),
+        ], add_btn))
         
         # Process List section
-        list_group = QGroupBox("Process List")
-        list_layout = QVBoxLayout(list_group)
-        list_layout.setSpacing(12)
-        
-        # Table
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(4)
-        self.process_table.setHorizontalHeaderLabels(["ID", "Name", "Priority", "State"])
-        self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.process_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.process_table.setAlternatingRowColors(True)
-        self.process_table.verticalHeader().setVisible(False)
-        self.process_table.setShowGrid(False)
-        list_layout.addWidget(self.process_table)
-        
-        # Buttons
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-        
-        remove_btn = QPushButton("Remove Selected")
-        remove_btn.setProperty("danger", True)
-        remove_btn.clicked.connect(self._remove_process)
-        btn_row.addWidget(remove_btn)
-        
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.setProperty("secondary", True)
-        refresh_btn.clicked.connect(self._refresh_processes)
-        btn_row.addWidget(refresh_btn)
-        
-        list_layout.addLayout(btn_row)
-        layout.addWidget(list_group)
+        self.process_table = self._make_table_view(self.process_model)
+        layout.addWidget(self._make_list_group(
+            "Process List", self.process_table, self._remove_process))
         
+        tab = QWidget()
+        tab.setLayout(layout)
         return tab
         
     def _create_resource_tab(self):
         """Create resource management tab"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        layout = QVBoxLayout()
         layout.setSpacing(12)
         layout.setContentsMargins(8, 12, 8, 8)
         
         # Add Resource section
-        add_group = QGroupBox("Add Resource")
-        add_layout = QVBoxLayout(add_group)
-        add_layout.setSpacing(12)
-        
-        # Name row
-        name_row = QHBoxLayout()
-        name_row.setSpacing(12)
-        name_label = QLabel("Name")
-        name_label.setFixedWidth(60)
-        name_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.resource_name_input = QLineEdit()
-        self.resource_name_input.setPlaceholderText("Enter resource name...")
-        name_row.addWidget(name_label)
-        name_row.addWidget(self.resource_name_input)
-        add_layout.addLayout(name_row)
-        
-        # Instances row
-        instances_row = QHBoxLayout()
-        instances_row.setSpacing(12)
-        instances_label = QLabel("Instances")
-        instances_label.setFixedWidth(60)
-        instances_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.resource_instances_input = QSpinBox()
-        self.resource_instances_input.setRange(1, 100)
-        self.resource_instances_input.setValue(1)
-        self.resource_instances_input.setFixedWidth(100)
-        instances_row.addWidget(instances_label)
-        instances_row.addWidget(self.resource_instances_input)
-        instances_row.addStretch()
-        add_layout.addLayout(instances_row)
-        
-        # Add button
+        self.resource_name_input = self._make_name_input("Enter resource name...")
+        self.resource_instances_input = self._make_spin(1, 100, 1)
         add_btn = QPushButton("Add Resource")
         add_btn.clicked.connect(self._add_resource)
-        add_layout.addWidget(add_btn)
-        
-        layout.addWidget(add_group)
+        layout.addWidget(self._make_form("Add Resource", [
+            ("Name", self.resource_name_input),
+            ("Instances", self.resource_instances_input),
+        ], add_btn))
         
         # Resource List section
-        list_group = QGroupBox("Resource List")
-        list_layout = QVBoxLayout(list_group)
-        list_layout.setSpacing(12)
+        self.resource_table = self._make_table_view(self.resource_model)
+        layout.addWidget(self._make_list_group(
+            "Resource List", self.resource_table, self._remove_resource))
+        
+        tab = QWidget()
+        tab.setLayout(layout)
+        return tab
+        
+    def _create_edge_tab(self):
+        """Create edge operations tab"""
+        layout = QVBoxLayout()
+        layout.setSpacing(12)
+        layout.setContentsMargins(8, 12, 8, 8)
+        
+        # Request / Allocate / Release sections
+        group, self.request_pid_input, self.request_rid_input = self._make_pid_rid_group(
+            "Request Resource", [("Request", self._request_resource, None)])
+        layout.addWidget(group)
+        
+        group, self.allocate_pid_input, self.allocate_rid_input = self._make_pid_rid_group(
+            "Allocate Resource", [("Allocate", self._allocate_resource, "success")])
+        layout.addWidget(group)
+        
+        group, self.release_pid_input, self.release_rid_input = self._make_pid_rid_group(
+            "Release Resource", [
+                ("Release", self._release_resource, None),
+                ("Release All", self._release_all, "secondary"),
+            ])
+        layout.addWidget(group)
+        
+        layout.addStretch()
         
-        # Table
-        self.resource_table = QTableWidget()
-        self.resource_table.setColumnCount(4)
-        self.resource_table.setHorizontalHeaderLabels(["ID", "Name", "Total", "Available"])
-        self.resource_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.resource_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.resource_table.setAlternatingRowColors(True)
-        self.resource_table.verticalHeader().setVisible(False)
-        self.resource_table.setShowGrid(False)
-        list_layout.addWidget(self.resource_table)
+        tab = QWidget()
+        tab.setLayout(layout)
+        return tab
+        
+    # ========================================================================
+    # Form Helpers
+    # ========================================================================
+    
+    def _make_form(self, title, fields, footer, label_width=60, spacing=12):
+        """
+        Build a titled group with one labelled row per input widget
+        
+        Args:
+            title: Group box title
+            fields: List of (label text, input widget) pairs
+            footer: Button (QWidget) or button row (QLayout) below the fields
+            label_width: Fixed width of the label column
+            spacing: Vertical spacing between rows
+            
+        Returns:
+            The group box
+        """
+        group_layout = QVBoxLayout()
+        group_layout.setSpacing(spacing)
+        
+        for text, widget in fields:
+            row = QHBoxLayout()
+            row.setSpacing(12)
+            label = QLabel(text)
+            label.setFixedWidth(label_width)
+            label.setProperty("role", "field")
+            row.addWidget(label)
+            row.addWidget(widget)
+            # Fixed-width spin boxes stay left-aligned; line edits fill the row
+            if isinstance(widget, QSpinBox):
+                row.addStretch()
+            group_layout.addLayout(row)
+            
+        if isinstance(footer, QWidget):
+            group_layout.addWidget(footer)
+        else:
+            group_layout.addLayout(footer)
+            
+        group = QGroupBox(title)
+        group.setLayout(group_layout)
+        return group
+        
+    def _make_pid_rid_group(self, title, buttons):
+        """
+        Build a Process ID / Resource ID form with a row of action buttons
+        
+        Args:
+            title: Group box title
+            buttons: List of (text, slot, style property or None) tuples
+            
+        Returns:
+            (group box, process id spin box, resource id spin box)
+        """
+        pid_input = self._make_spin(0, 999)
+        rid_input = self._make_spin(0, 999)
+        
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(8)
+        for text, slot, prop in buttons:
+            btn = QPushButton(text)
+            if prop:
+                btn.setProperty(prop, True)
+            btn.clicked.connect(slot)
+            btn_row.addWidget(btn)
+            
+        group = self._make_form(title, [
+            ("Process ID", pid_input),
+            ("Resource ID", rid_input),
+        ], btn_row, label_width=80, spacing=10)
+        return group, pid_input, rid_input
+        
+    def _make_list_group(self, title, view, remove_slot):
+        """
+        Build a titled group holding a list view with Remove/Refresh buttons
+        
+        Args:
+            title: Group box title
+            view: Table view to show
+            remove_slot: Slot for the Remove Selected button
+            
+        Returns:
+            The group box
+        """
+        list_layout = QVBoxLayout()
+        list_layout.setSpacing(12)
+        list_layout.addWidget(view)
         
         # Buttons
         btn_row = QHBoxLayout()
@@ -201,185 +420,81 @@ class ControlPanel(QWidget):
         
         remove_btn = QPushButton("Remove Selected")
         remove_btn.setProperty("danger", True)
-        remove_btn.clicked.connect(self._remove_resource)
+        remove_btn.clicked.connect(remove_slot)
         btn_row.addWidget(remove_btn)
         
         refresh_btn = QPushButton("Refresh")
         refresh_btn.setProperty("secondary", True)
-        refresh_btn.clicked.connect(self._refresh_resources)
+        refresh_btn.clicked.connect(self.reload)
         btn_row.addWidget(refresh_btn)
         
         list_layout.addLayout(btn_row)
-        layout.addWidget(list_group)
         
-        return tab
-        
-    def _create_edge_tab(self):
-        """Create edge operations tab"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setSpacing(12)
-        layout.setContentsMargins(8, 12, 8, 8)
-        
-        # Request Resource section
-        request_group = QGroupBox("Request Resource")
-        request_layout = QVBoxLayout(request_group)
-        request_layout.setSpacing(10)
-        
-        req_row1 = QHBoxLayout()
-        req_row1.setSpacing(12)
-        pid_label = QLabel("Process ID")
-        pid_label.setFixedWidth(80)
-        pid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.request_pid_input = QSpinBox()
-        self.request_pid_input.setRange(0, 999)
-        self.request_pid_input.setFixedWidth(100)
-        req_row1.addWidget(pid_label)
-        req_row1.addWidget(self.request_pid_input)
-        req_row1.addStretch()
-        request_layout.addLayout(req_row1)
-        
-        req_row2 = QHBoxLayout()
-        req_row2.setSpacing(12)
-        rid_label = QLabel("Resource ID")
-        rid_label.setFixedWidth(80)
-        rid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.request_rid_input = QSpinBox()
-        self.request_rid_input.setRange(0, 999)
-        self.request_rid_input.setFixedWidth(100)
-        req_row2.addWidget(rid_label)
-        req_row2.addWidget(self.request_rid_input)
-        req_row2.addStretch()
-        request_layout.addLayout(req_row2)
-        
-        request_btn = QPushButton("Request")
-        request_btn.clicked.connect(self._request_resource)
-        request_layout.addWidget(request_btn)
-        
-        layout.addWidget(request_group)
-        
-        # Allocate Resource section
-        allocate_group = QGroupBox("Allocate Resource")
-        allocate_layout = QVBoxLayout(allocate_group)
-        allocate_layout.setSpacing(10)
-        
-        alloc_row1 = QHBoxLayout()
-        alloc_row1.setSpacing(12)
-        alloc_pid_label = QLabel("Process ID")
-        alloc_pid_label.setFixedWidth(80)
-        alloc_pid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.allocate_pid_input = QSpinBox()
-        self.allocate_pid_input.setRange(0, 999)
-        self.allocate_pid_input.setFixedWidth(100)
-        alloc_row1.addWidget(alloc_pid_label)
-        alloc_row1.addWidget(self.allocate_pid_input)
-        alloc_row1.addStretch()
-        allocate_layout.addLayout(alloc_row1)
-        
-        alloc_row2 = QHBoxLayout()
-        alloc_row2.setSpacing(12)
-        alloc_rid_label = QLabel("Resource ID")
-        alloc_rid_label.setFixedWidth(80)
-        alloc_rid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.allocate_rid_input = QSpinBox()
-        self.allocate_rid_input.setRange(0, 999)
-        self.allocate_rid_input.setFixedWidth(100)
-        alloc_row2.addWidget(alloc_rid_label)
-        alloc_row2.addWidget(self.allocate_rid_input)
-        alloc_row2.addStretch()
-        allocate_layout.addLayout(alloc_row2)
-        
-        allocate_btn = QPushButton("Allocate")
-        allocate_btn.setProperty("success", True)
-        allocate_btn.clicked.connect(self._allocate_resource)
-        allocate_layout.addWidget(allocate_btn)
-        
-        layout.addWidget(allocate_group)
-        
-        # Release Resource section
-        release_group = QGroupBox("Release Resource")
-        release_layout = QVBoxLayout(release_group)
-        release_layout.setSpacing(10)
-        
-        rel_row1 = QHBoxLayout()
-        rel_row1.setSpacing(12)
-        rel_pid_label = QLabel("Process ID")
-        rel_pid_label.setFixedWidth(80)
-        rel_pid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.release_pid_input = QSpinBox()
-        self.release_pid_input.setRange(0, 999)
-        self.release_pid_input.setFixedWidth(100)
-        rel_row1.addWidget(rel_pid_label)
-        rel_row1.addWidget(self.release_pid_input)
-        rel_row1.addStretch()
-        release_layout.addLayout(rel_row1)
-        
-        rel_row2 = QHBoxLayout()
-        rel_row2.setSpacing(12)
-        rel_rid_label = QLabel("Resource ID")
-        rel_rid_label.setFixedWidth(80)
-        rel_rid_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-weight: 500;")
-        self.release_rid_input = QSpinBox()
-        self.release_rid_input.setRange(0, 999)
-        self.release_rid_input.setFixedWidth(100)
-        rel_row2.addWidget(rel_rid_label)
-        rel_row2.addWidget(self.release_rid_input)
-        rel_row2.addStretch()
-        release_layout.addLayout(rel_row2)
-        
-        rel_btn_row = QHBoxLayout()
-        rel_btn_row.setSpacing(8)
-        
-        release_btn = QPushButton("Release")
-        release_btn.clicked.connect(self._release_resource)
-        rel_btn_row.addWidget(release_btn)
-        
-        release_all_btn = QPushButton("Release All")
-        release_all_btn.setProperty("secondary", True)
-        release_all_btn.clicked.connect(self._release_all)
-        rel_btn_row.addWidget(release_all_btn)
-        
-        release_layout.addLayout(rel_btn_row)
-        layout.addWidget(release_group)
-        
-        layout.addStretch()
-        
-        return tab
+        group = QGroupBox(title)
+        group.setLayout(list_layout)
+        return group
+        
+    @staticmethod
+    def _make_name_input(placeholder):
+        """
+        Create a line edit that only accepts names the backend can store
+        
+        Args:
+            placeholder: Placeholder text
+        """
+        edit = QLineEdit()
+        edit.setPlaceholderText(placeholder)
+        edit.setMaxLength(_NAME_MAX_LENGTH)
+        edit.setValidator(QRegularExpressionValidator(_NAME_PATTERN, edit))
+        return edit
+        
+    @staticmethod
+    def _make_spin(minimum, maximum, value=None):
+        """
+        Create a fixed-width spin box
+        
+        Args:
+            minimum: Lowest accepted value
+            maximum: Highest accepted value
+            value: Initial value (defaults to minimum)
+        """
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        if value is not None:
+            spin.setValue(value)
+        spin.setFixedWidth(100)
+        return spin
         
     # ========================================================================
     # Process Operations
     # ========================================================================
     
-    def _add_process(self):
+    @async_handler
+    async def _add_process(self):
         """Add a new process"""
         name = self.process_name_input.text().strip()
         priority = self.process_priority_input.value()
         
         if not name:
-            QMessageBox.warning(self, "Error", "Please enter a process name")
+            self._flash_status("Please enter a process name")
             return
             
         try:
-            response = self.backend.add_process(name, priority)
-            if response and response.get('status') == 'success':
+            response = await run_blocking(self.backend.add_process, name, priority)
+            if self._handle_response(response, "Failed to add process"):
                 self.process_name_input.clear()
-                self._refresh_processes()
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error", 
-                    f"Failed to add process: {response.get('message', 'Unknown error')}")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to add process: {e}")
+            self._report_error("Failed to add process", e)
             
-    def _remove_process(self):
+    @async_handler
+    async def _remove_process(self):
         """Remove selected process"""
-        selected = self.process_table.selectedItems()
+        selected = self.process_table.selectionModel().selectedRows()
         if not selected:
-            QMessageBox.warning(self, "Warning", "Please select a process to remove")
+            self._flash_status("Please select a process to remove")
             return
             
-        row = selected[0].row()
-        pid = int(self.process_table.item(row, 0).text())
+        pid = selected[0].data(_ID_ROLE)
         
         reply = QMessageBox.question(self, "Confirm", f"Remove process P{pid}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -387,81 +502,80 @@ class ControlPanel(QWidget):
             return
             
         try:
-            response = self.backend.remove_process(pid)
-            if response and response.get('status') == 'success':
-                self._refresh_processes()
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed to remove process: {response.get('message', 'Unknown error')}")
+            response = await run_blocking(self.backend.remove_process, pid)
+            self._handle_response(response, "Failed to remove process")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to remove process: {e}")
+            self._report_error("Failed to remove process", e)
             
-    def _refresh_processes(self):
-        """Refresh process list"""
-        self.process_table.setRowCount(0)
-        
+    @async_handler
+    async def _refresh_processes(self):
+        """Refresh process list (a call while one is in flight is skipped)"""
+        if self._process_gen is not None and self._process_gen == self.backend.generation:
+            return
+        # Claim the current generation up front so the refresh that follows
+        # every updated notification does not query the list a second time
+        self._process_gen = self.backend.generation
         try:
-            response = self.backend.list_processes()
-            if response and response.get('status') == 'success':
-                import json
-                data = response.get('data', '[]')
-                if isinstance(data, str):
-                    processes = json.loads(data)
-                else:
-                    processes = data
-                    
-                for process in processes:
-                    row = self.process_table.rowCount()
-                    self.process_table.insertRow(row)
-                    
-                    # Center-align items
-                    for col, value in enumerate([
-                        str(process['id']),
-                        process['name'],
-                        str(process['priority']),
-                        process['state'].upper()
-                    ]):
-                        item = QTableWidgetItem(value)
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.process_table.setItem(row, col, item)
-        except Exception as e:
-            print(f"Error refreshing processes: {e}")
+            response = await run_blocking(self.backend.list_processes)
+            if self._ok(response):
+                self._process_gen = response.get('gen')
+                # The backend interface decodes responses, so data is already a list
+                self._apply_processes(response.get('data') or [])
+                return
+        except _REFRESH_ERRORS as e:
+            log.error("refresh_processes failed: %s", e)
+        self._process_gen = None
+            
+    def _apply_processes(self, processes):
+        """
+        Show a fetched process list (runs on the GUI thread)
+        
+        Args:
+            processes: List of process dicts from the backend
+        """
+        # Cached responses hand back the same payload object
+        last = self._last_process_payload
+        if processes is last or processes == last:
+            return
+        self._last_process_payload = processes
+        
+        state_text = _STATE_UPPER.get
+        rows = {p['id']: (_int_text(p['id']), p['name'], _int_text(p['priority']),
+                          state_text(p['state']) or sys.intern(p['state'].upper()))
+                for p in processes}
+        with bulk_update(self.process_table):
+            self.process_model.set_rows(rows)
             
     # ========================================================================
     # Resource Operations
     # ========================================================================
     
-    def _add_resource(self):
+    @async_handler
+    async def _add_resource(self):
         """Add a new resource"""
         name = self.resource_name_input.text().strip()
         instances = self.resource_instances_input.value()
         
         if not name:
-            QMessageBox.warning(self, "Error", "Please enter a resource name")
+            self._flash_status("Please enter a resource name")
             return
             
         try:
-            response = self.backend.add_resource(name, instances)
-            if response and response.get('status') == 'success':
+            response = await run_blocking(self.backend.add_resource, name, instances)
+            if self._handle_response(response, "Failed to add resource"):
                 self.resource_name_input.clear()
-                self._refresh_resources()
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed to add resource: {response.get('message', 'Unknown error')}")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to add resource: {e}")
+            self._report_error("Failed to add resource", e)
             
-    def _remove_resource(self):
+    @async_handler
+    async def _remove_resource(self):
         """Remove selected resource"""
-        selected = self.resource_table.selectedItems()
+        selected = self.resource_table.selectionModel().selectedRows()
         if not selected:
-            QMessageBox.warning(self, "Warning", "Please select a resource to remove")
+            self._flash_status("Please select a resource to remove")
             return
             
-        row = selected[0].row()
-        rid = int(self.resource_table.item(row, 0).text())
+        rid = selected[0].data(_ID_ROLE)
         
         reply = QMessageBox.question(self, "Confirm", f"Remove resource R{rid}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -469,110 +583,208 @@ class ControlPanel(QWidget):
             return
             
         try:
-            response = self.backend.remove_resource(rid)
-            if response and response.get('status') == 'success':
-                self._refresh_resources()
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed to remove resource: {response.get('message', 'Unknown error')}")
+            response = await run_blocking(self.backend.remove_resource, rid)
+            self._handle_response(response, "Failed to remove resource")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to remove resource: {e}")
+            self._report_error("Failed to remove resource", e)
             
-    def _refresh_resources(self):
-        """Refresh resource list"""
-        self.resource_table.setRowCount(0)
-        
+    @async_handler
+    async def _refresh_resources(self):
+        """Refresh resource list (a call while one is in flight is skipped)"""
+        if self.resource_table is None:
+            return
+        if self._resource_gen is not None and self._resource_gen == self.backend.generation:
+            return
+        # Claim the current generation up front so the refresh that follows
+        # every updated notification does not query the list a second time
+        self._resource_gen = self.backend.generation
         try:
-            response = self.backend.list_resources()
-            if response and response.get('status') == 'success':
-                import json
-                data = response.get('data', '[]')
-                if isinstance(data, str):
-                    resources = json.loads(data)
-                else:
-                    resources = data
-                    
-                for resource in resources:
-                    row = self.resource_table.rowCount()
-                    self.resource_table.insertRow(row)
-                    
-                    for col, value in enumerate([
-                        str(resource['id']),
-                        resource['name'],
-                        str(resource['total_instances']),
-                        str(resource['available_instances'])
-                    ]):
-                        item = QTableWidgetItem(value)
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.resource_table.setItem(row, col, item)
-        except Exception as e:
-            print(f"Error refreshing resources: {e}")
+            response = await run_blocking(self.backend.list_resources)
+            if self._ok(response):
+                self._resource_gen = response.get('gen')
+                # The backend interface decodes responses, so data is already a list
+                self._apply_resources(response.get('data') or [])
+                return
+        except _REFRESH_ERRORS as e:
+            log.error("refresh_resources failed: %s", e)
+        self._resource_gen = None
+            
+    def _apply_resources(self, resources):
+        """
+        Show a fetched resource list (runs on the GUI thread)
+        
+        Args:
+            resources: List of resource dicts from the backend
+        """
+        # Cached responses hand back the same payload object
+        last = self._last_resource_payload
+        if resources is last or resources == last:
+            return
+        self._last_resource_payload = resources
+        
+        rows = {r['id']: (_int_text(r['id']), r['name'],
+                          _int_text(r['total_instances']),
+                          _int_text(r['available_instances']))
+                for r in resources}
+        with bulk_update(self.resource_table):
+            self.resource_model.set_rows(rows)
             
+    # ========================================================================
+    # Table Helpers
+    # ========================================================================
+    
+    @staticmethod
+    def _make_table_view(model):
+        """
+        Create a read-only, row-selecting view over a RowTableModel
+        
+        Args:
+            model: Model to show
+        """
+        view = QTableView()
+        view.setModel(model)
+        # The view does not own its delegate; parent it so they die together
+        view.setItemDelegate(RowDelegate(view))
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        # Removal acts on one row; single selection keeps selectedRows() to one index
+        view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        view.setAlternatingRowColors(True)
+        view.verticalHeader().setVisible(False)
+        view.setShowGrid(False)
+        return view
+    
     # ========================================================================
     # Edge Operations
     # ========================================================================
     
-    def _request_resource(self):
+    @async_handler
+    async def _request_resource(self):
         """Create a request edge"""
         pid = self.request_pid_input.value()
         rid = self.request_rid_input.value()
         
-        try:
-            response = self.backend.request_resource(pid, rid)
-            if response and response.get('status') == 'success':
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to request resource: {e}")
+        await self._edge_operation(self.backend.request_resource, pid, rid,
+                                   error="Failed to request resource")
             
-    def _allocate_resource(self):
+    @async_handler
+    async def _allocate_resource(self):
         """Allocate a resource to a process"""
         pid = self.allocate_pid_input.value()
         rid = self.allocate_rid_input.value()
         
-        try:
-            response = self.backend.allocate_resource(pid, rid)
-            if response and response.get('status') == 'success':
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to allocate resource: {e}")
+        await self._edge_operation(self.backend.allocate_resource, pid, rid,
+                                   error="Failed to allocate resource")
             
-    def _release_resource(self):
+    @async_handler
+    async def _release_resource(self):
         """Release a resource from a process"""
         pid = self.release_pid_input.value()
         rid = self.release_rid_input.value()
         
-        try:
-            response = self.backend.release_resource(pid, rid)
-            if response and response.get('status') == 'success':
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to release resource: {e}")
+        await self._edge_operation(self.backend.release_resource, pid, rid,
+                                   error="Failed to release resource")
             
-    def _release_all(self):
+    @async_handler
+    async def _release_all(self):
         """Release all resources for a process"""
         pid = self.release_pid_input.value()
         
+        await self._edge_operation(self.backend.release_all, pid,
+                                   error="Failed to release resources")
+            
+    async def _edge_operation(self, fn, *args, error):
+        """
+        Run an edge command and report its outcome
+        
+        Args:
+            fn: Backend method to call
+            *args: Arguments for fn
+            error: Message prefix shown if the call raises
+        """
         try:
-            response = self.backend.release_all(pid)
-            if response and response.get('status') == 'success':
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
+            response = await run_blocking(fn, *args)
+            self._handle_response(response, error)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to release resources: {e}")
+            self._report_error(error, e)
+            
+    @staticmethod
+    def _ok(response):
+        """Whether a backend response reports success"""
+        return response is not None and response.get('status') == 'success'
+        
+    def _handle_response(self, response, failure):
+        """
+        Report the outcome of a state-changing command
+        
+        On success the backend's message goes to the status line and a
+        coalesced refresh is scheduled; otherwise a warning is shown.
+        
+        Args:
+            response: Backend response (None if the backend did not answer)
+            failure: Message prefix shown on failure
+            
+        Returns:
+            True if the command succeeded
+        """
+        if self._ok(response):
+            self._flash_status(response.get('message', 'Done'))
+            self._request_update()
+            return True
+        message = response.get('message', 'Unknown error') if response else "No response from backend"
+        QMessageBox.warning(self, "Error", f"{failure}: {message}")
+        return False
+        
+    def _report_error(self, prefix, error):
+        """
+        Log and show a failed backend call
+        
+        Args:
+            prefix: Message shown before the exception text
+            error: Exception raised by the call
+        """
+        log.error("%s: %s", prefix, error)
+        QMessageBox.critical(self, "Error", f"{prefix}: {error}")
+            
+    def _flash_status(self, text, timeout=2500):
+        """
+        Show a message on the status line and clear it after a delay
+        
+        Args:
+            text: Message to show
+            timeout: Milliseconds before the message is cleared
+        """
+        self.status_label.setText(text)
+        self._status_timer.start(timeout)
+        
+    def _request_update(self):
+        """
+        Refresh the lists and emit updated once a burst of operations settles
+        
+        Operations finishing within 25 ms of each other share a single
+        notification, so listeners refresh once rather than per operation.
+        """
+        self._update_timer.start()
+        
+    def _flush_update(self):
+        """Deliver the queued refresh and updated notification"""
+        self.refresh()
+        self.updated.emit()
             
     def refresh(self):
-        """Refresh all lists"""
-        self._refresh_processes()
-        self._refresh_resources()
+        """
+        Refresh the list on the visible tab
+        
+        Hidden lists are brought up to date when their tab is selected;
+        the generation check makes that free if nothing changed meanwhile.
+        """
+        index = self.tabs.currentIndex()
+        if index == 0:
+            self._refresh_processes()
+        elif index == 1:
+            self._refresh_resources()
+        
+    def reload(self):
+        """Re-query all lists even if the backend generation is unchanged"""
+        self._process_gen = self._resource_gen = None
+        self.refresh()
@@ -4,19 +4,28 @@ Deadlock Panel Component (PyQt6)
 Provides interface for deadlock detection and recovery.
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
-    QPushButton, QComboBox, QTextEdit, QFrame, QMessageBox, QSpinBox
+    QPushButton, QComboBox, QFrame, QMessageBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QTextCharFormat
-
-import sys
-import os
-import json
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
 from utils.theme_qt import COLORS, get_font
+from utils.qt_utils import async_handler, run_blocking, set_style_property
+
+
+# Recovery strategies as (backend id, display name)
+_STRATEGIES = (
+    (1, "Terminate All"),
+    (2, "Terminate Lowest Priority"),
+    (3, "Terminate One"),
+    (4, "Iterative Termination"),
+    (5, "Preempt Resources"),
+    (6, "Rollback"),
+)
+_DEFAULT_STRATEGY = 2
 
 
 class StatusIndicator(QFrame):
@@ -25,6 +34,7 @@ class StatusIndicator(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(40)
+        self._status = None
         self._setup_ui()
         self.set_status("unknown")
         
@@ -45,47 +55,25 @@ class StatusIndicator(QFrame):
         
         layout.addStretch()
         
+    # Icon and text per status; colors come from the theme's
+    # QFrame[status=...] rules
+    _STATUS_TEXT = {
+        'deadlock': ("⚠", "Deadlock Detected"),
+        'safe': ("✓", "System Safe"),
+        'unknown': ("○", "Not checked"),
+    }
+    
     def set_status(self, status):
         """Set status: 'deadlock', 'safe', or 'unknown'"""
-        if status == 'deadlock':
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['error']};
-                    border-radius: 6px;
-                }}
-                QLabel {{
-                    color: white;
-                    background: transparent;
-                }}
-            """)
-            self.icon_label.setText("⚠")
-            self.text_label.setText("Deadlock Detected")
-        elif status == 'safe':
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['success']};
-                    border-radius: 6px;
-                }}
-                QLabel {{
-                    color: white;
-                    background: transparent;
-                }}
-            """)
-            self.icon_label.setText("✓")
-            self.text_label.setText("System Safe")
-        else:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['bg_tertiary']};
-                    border-radius: 6px;
-                }}
-                QLabel {{
-                    color: {COLORS['text_muted']};
-                    background: transparent;
-                }}
-            """)
-            self.icon_label.setText("○")
-            self.text_label.setText("Not checked")
+        if status not in self._STATUS_TEXT:
+            status = 'unknown'
+        if status == self._status:
+            return
+        self._status = status
+        icon, text = self._STATUS_TEXT[status]
+        set_style_property(self, "status", status)
+        self.icon_label.setText(icon)
+        self.text_label.setText(text)
 
 
 class DeadlockPanel(QWidget):
@@ -97,7 +85,22 @@ class DeadlockPanel(QWidget):
         super().__init__(parent)
         self.backend = backend
         self.detection_result = None
-        self._setup_ui()
+        # Widgets are built on first show, so a tab that is never opened
+        # costs nothing at startup
+        self._built = False
+        
+        # Coalesces updated notifications from back-to-back operations
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(25)
+        self._update_timer.timeout.connect(self.updated.emit)
+        
+    def showEvent(self, event):
+        """Build the widgets the first time the panel becomes visible"""
+        if not self._built:
+            self._built = True
+            self._setup_ui()
+        super().showEvent(event)
         
     def _setup_ui(self):
         """Setup the UI"""
@@ -128,10 +131,10 @@ class DeadlockPanel(QWidget):
         circular_row.addWidget(proc_label)
         circular_row.addStretch()
         
-        load_btn = QPushButton("Load")
-        load_btn.setFixedWidth(70)
-        load_btn.clicked.connect(self._load_scenario)
-        circular_row.addWidget(load_btn)
+        self.load_btn = QPushButton("Load")
+        self.load_btn.setFixedWidth(70)
+        self.load_btn.clicked.connect(self._load_scenario)
+        circular_row.addWidget(self.load_btn)
         
         scenario_layout.addLayout(circular_row)
         layout.addWidget(scenario_group)
@@ -146,17 +149,13 @@ class DeadlockPanel(QWidget):
         detection_layout.addWidget(self.status_indicator)
         
         # Detect button
-        detect_btn = QPushButton("Run Detection")
-        detect_btn.clicked.connect(self._detect_deadlock)
-        detection_layout.addWidget(detect_btn)
+        self.detect_btn = QPushButton("Run Detection")
+        self.detect_btn.clicked.connect(self._detect_deadlock)
+        detection_layout.addWidget(self.detect_btn)
         
         # Results text
-        self.results_text = QTextEdit()
-        self.results_text.setReadOnly(True)
-        self.results_text.setMinimumHeight(70)
-        self.results_text.setMaximumHeight(90)
-        self.results_text.setPlaceholderText("Detection results will appear here...")
-        detection_layout.addWidget(self.results_text)
+        self.results_label = self._make_output("Detection results will appear here...", 70, 90)
+        detection_layout.addWidget(self.results_label)
         
         layout.addWidget(detection_group)
         
@@ -174,16 +173,12 @@ class DeadlockPanel(QWidget):
         strategy_label.setFixedWidth(60)
         strategy_row.addWidget(strategy_label)
         
+        # Each entry carries the backend strategy id as its item data, so
+        # the selection maps to the id without relying on list positions
         self.strategy_combo = QComboBox()
-        self.strategy_combo.addItems([
-            "Terminate All",
-            "Terminate Lowest Priority",
-            "Terminate One",
-            "Iterative Termination",
-            "Preempt Resources",
-            "Rollback"
-        ])
-        self.strategy_combo.setCurrentIndex(1)
+        for strategy_id, name in _STRATEGIES:
+            self.strategy_combo.addItem(name, strategy_id)
+        self.strategy_combo.setCurrentIndex(self.strategy_combo.findData(_DEFAULT_STRATEGY))
         strategy_row.addWidget(self.strategy_combo)
         recovery_layout.addLayout(strategy_row)
         
@@ -191,101 +186,168 @@ class DeadlockPanel(QWidget):
         btn_row = QHBoxLayout()
         btn_row.setSpacing(8)
         
-        recommend_btn = QPushButton("Recommend")
-        recommend_btn.setProperty("secondary", True)
-        recommend_btn.clicked.connect(self._recommend_strategy)
-        btn_row.addWidget(recommend_btn)
+        self.recommend_btn = QPushButton("Recommend")
+        self.recommend_btn.setProperty("secondary", True)
+        self.recommend_btn.clicked.connect(self._recommend_strategy)
+        btn_row.addWidget(self.recommend_btn)
         
-        recover_btn = QPushButton("Execute Recovery")
-        recover_btn.clicked.connect(self._recover)
-        btn_row.addWidget(recover_btn)
+        self.recover_btn = QPushButton("Execute Recovery")
+        self.recover_btn.clicked.connect(self._recover)
+        btn_row.addWidget(self.recover_btn)
         
         recovery_layout.addLayout(btn_row)
         
         # Recovery results
-        self.recovery_text = QTextEdit()
-        self.recovery_text.setReadOnly(True)
-        self.recovery_text.setMinimumHeight(50)
-        self.recovery_text.setMaximumHeight(70)
-        self.recovery_text.setPlaceholderText("Recovery results will appear here...")
-        recovery_layout.addWidget(self.recovery_text)
+        self.recovery_label = self._make_output("Recovery results will appear here...", 50, 70)
+        recovery_layout.addWidget(self.recovery_label)
         
         layout.addWidget(recovery_group)
         layout.addStretch()
         
-    def _load_scenario(self):
-        """Load circular wait scenario"""
+        self._action_buttons = (self.load_btn, self.detect_btn,
+                                self.recommend_btn, self.recover_btn)
+        
+    @staticmethod
+    def _make_output(placeholder, min_height, max_height):
+        """
+        Create a label for a few lines of result text
+        
+        Results are short and replaced wholesale, so a selectable QLabel
+        does the job without a text document and its layout engine.
+        
+        Args:
+            placeholder: Text shown (muted) until the first result
+            min_height: Minimum height in pixels
+            max_height: Maximum height in pixels
+        """
+        label = QLabel(placeholder)
+        label.setProperty("role", "output")
+        label.setProperty("tone", "muted")
+        label.setWordWrap(True)
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        label.setMinimumHeight(min_height)
+        label.setMaximumHeight(max_height)
+        return label
+        
+    @contextmanager
+    def _busy(self):
+        """
+        Disable the action buttons while a backend call is in flight
+        
+        The calls run off the GUI thread, so the panel stays interactive;
+        disabling the buttons keeps a second click from overlapping the first.
+        """
+        for btn in self._action_buttons:
+            btn.setEnabled(False)
         try:
-            self.backend.sim_init()
-            response = self.backend.sim_load_scenario(1)  # 1 = Circular Wait
-            if response and response.get('status') == 'success':
-                n = self.circular_n_input.value()
-                self.results_text.clear()
-                self.results_text.setPlainText(f"Loaded circular wait with {n} processes")
-                self.status_indicator.set_status("unknown")
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load: {e}")
+            yield
+        finally:
+            for btn in self._action_buttons:
+                btn.setEnabled(True)
         
-    def _detect_deadlock(self):
-        """Detect deadlock in current RAG"""
+    async def _call_backend(self, fn, *args, error="Failed"):
+        """
+        Run a backend command off the GUI thread and unwrap its payload
+        
+        Failures are reported here, so callers only handle success.
+        
+        Args:
+            fn: Backend method to call
+            *args: Arguments for fn
+            error: Message prefix shown if the command fails
+            
+        Returns:
+            The response data (a dict), or None if the command failed
+        """
         try:
-            response = self.backend.detect_deadlock()
-            if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, str):
-                    data = json.loads(data)
-                
-                self.detection_result = data
-                deadlock_detected = data.get('deadlock_detected', False)
-                
-                # Update status indicator
-                self.status_indicator.set_status('deadlock' if deadlock_detected else 'safe')
-                
-                # Display results
-                self.results_text.clear()
-                
-                if deadlock_detected:
-                    self.results_text.setStyleSheet(f"color: {COLORS['error']};")
-                    self.results_text.append(f"Cycles found: {data.get('cycle_count', 0)}")
-                    
-                    deadlocked_processes = data.get('deadlocked_processes', [])
-                    if deadlocked_processes:
-                        pids = ", ".join([f"P{pid}" for pid in deadlocked_processes])
-                        self.results_text.append(f"Involved: {pids}")
-                else:
-                    self.results_text.setStyleSheet(f"color: {COLORS['success']};")
-                    self.results_text.append("No deadlock detected")
-                    self.results_text.append("System is in a safe state")
-                
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
+            with self._busy():
+                response = await run_blocking(fn, *args)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to detect: {e}")
+            QMessageBox.critical(self, "Error", f"{error}: {e}")
+            return None
+        
+        if response is None or response.get('status') != 'success':
+            message = response.get('message', 'Unknown error') if response else "No response from backend"
+            QMessageBox.warning(self, "Error", f"{error}: {message}")
+            return None
+        # The backend interface decodes responses, so data is already a dict
+        return response.get('data') or {}
+        
+    @async_handler
+    async def _load_scenario(self):
+        """Load circular wait scenario"""
+        if await self._call_backend(self.backend.sim_init, error="Failed to load") is None:
+            return
+        # 1 = Circular Wait
+        if await self._call_backend(self.backend.sim_load_scenario, 1,
+                                    error="Failed to load") is None:
+            return
+        
+        # The old result describes the previous graph
+        self.detection_result = None
+        n = self.circular_n_input.value()
+        self.results_label.setText(f"Loaded circular wait with {n} processes")
+        self.status_indicator.set_status("unknown")
+        self._request_update()
+        
+    @async_handler
+    async def _detect_deadlock(self):
+        """Detect deadlock in current RAG"""
+        data = await self._call_backend(self.backend.detect_deadlock, error="Failed to detect")
+        if data is None:
+            return
+        # Re-detecting an unchanged graph yields the same (or an equal)
+        # result; the labels already show it, so only notify listeners
+        last = self.detection_result
+        if data is not last and data != last:
+            self.detection_result = data
+            self._show_detection(data)
+        
+        self._request_update()
+        
+    def _show_detection(self, data):
+        """
+        Render a detection result in the status indicator and results label
+        
+        Args:
+            data: Response dictionary from detect_deadlock
+        """
+        deadlock_detected = data.get('deadlock_detected', False)
+        
+        # Update status indicator
+        self.status_indicator.set_status('deadlock' if deadlock_detected else 'safe')
+        
+        # Display results: build the text first and set it in one
+        # call, so the document is laid out once
+        if deadlock_detected:
+            lines = [f"Cycles found: {data.get('cycle_count', 0)}"]
+            
+            deadlocked_processes = data.get('deadlocked_processes', [])
+            if deadlocked_processes:
+                pids = "P" + ", P".join(map(str, deadlocked_processes))
+                lines.append(f"Involved: {pids}")
+            tone = 'error'
+        else:
+            lines = ["No deadlock detected", "System is in a safe state"]
+            tone = 'success'
+        
+        set_style_property(self.results_label, "tone", tone)
+        self.results_label.setText("\n".join(lines))
             
-    def _recommend_strategy(self):
+    @async_handler
+    async def _recommend_strategy(self):
         """Get recommended recovery strategy"""
-        try:
-            response = self.backend.recommend_strategy()
-            if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, str):
-                    data = json.loads(data)
-                
-                strategy_id = data.get('strategy', 2)
-                self.strategy_combo.setCurrentIndex(strategy_id - 1)
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed: {e}")
+        data = await self._call_backend(self.backend.recommend_strategy)
+        if data is None:
+            return
+        
+        index = self.strategy_combo.findData(data.get('strategy', _DEFAULT_STRATEGY))
+        if index >= 0:
+            self.strategy_combo.setCurrentIndex(index)
             
-    def _recover(self):
+    @async_handler
+    async def _recover(self):
         """Execute recovery"""
         if not self.detection_result or not self.detection_result.get('deadlock_detected', False):
             reply = QMessageBox.question(self, "No Deadlock",
@@ -294,36 +356,38 @@ class DeadlockPanel(QWidget):
             if reply != QMessageBox.StandardButton.Yes:
                 return
         
-        strategy = self.strategy_combo.currentIndex() + 1
+        strategy = self.strategy_combo.currentData()
         
-        try:
-            response = self.backend.recover(strategy, 1)
-            if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, str):
-                    data = json.loads(data)
-                
-                self.recovery_text.clear()
-                
-                success = data.get('success', False)
-                if success:
-                    self.recovery_text.setStyleSheet(f"color: {COLORS['success']};")
-                    self.recovery_text.append("Recovery successful")
-                else:
-                    self.recovery_text.setStyleSheet(f"color: {COLORS['warning']};")
-                    self.recovery_text.append("Recovery attempted")
-                
-                terminated = data.get('processes_terminated', 0)
-                if terminated > 0:
-                    self.recovery_text.append(f"Terminated: {terminated} process(es)")
-                
-                self.updated.emit()
-            else:
-                QMessageBox.warning(self, "Error",
-                    f"Failed: {response.get('message', 'Unknown error')}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed: {e}")
+        data = await self._call_backend(self.backend.recover, strategy, 1)
+        if data is None:
+            return
+        
+        success = data.get('success', False)
+        if success:
+            lines = ["Recovery successful"]
+            tone = 'success'
+        else:
+            lines = ["Recovery attempted"]
+            tone = 'warning'
+        
+        terminated = data.get('processes_terminated', 0)
+        if terminated > 0:
+            lines.append(f"Terminated: {terminated} process(es)")
+        
+        set_style_property(self.recovery_label, "tone", tone)
+        self.recovery_label.setText("\n".join(lines))
+        
+        self._request_update()
             
+    def _request_update(self):
+        """
+        Emit updated once a burst of operations settles
+        
+        Operations finishing within 25 ms of each other share a single
+        notification, so listeners refresh once rather than per operation.
+        """
+        self._update_timer.start()
+        
     def refresh(self):
         """Refresh detection"""
         pass
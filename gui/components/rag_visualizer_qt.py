@@ -5,25 +5,69 @@ Provides visual representation of the Resource Allocation Graph using QGraphicsV
 Features smooth animations, glow effects, and interactive node dragging.
 """
 
+import functools
 import math
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
     QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsLineItem,
-    QGraphicsTextItem, QGraphicsDropShadowEffect, QPushButton,
+    QGraphicsSimpleTextItem, QGraphicsDropShadowEffect, QPushButton,
     QLabel, QButtonGroup, QRadioButton, QFrame, QGraphicsItem
 )
 from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF, pyqtSignal, QTimer
 from PyQt6.QtGui import (
-    QPen, QBrush, QColor, QPainter, QFont, QPainterPath,
+    QPen, QBrush, QPainter, QFont, QPainterPath,
     QRadialGradient, QLinearGradient
 )
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.theme_qt import COLORS, get_font
+from utils.theme_qt import COLORS, get_color, get_font
 from utils.graph_layout import GraphLayout
+from utils.qt_utils import async_handler, run_blocking, throttle
+
+
+@functools.lru_cache(maxsize=None)
+def _node_paint(color_key):
+    """Shared fill brush and outline pen for nodes of one palette color"""
+    color = get_color(color_key)
+    return QBrush(color), QPen(color.lighter(120), 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _text_brush(color_key):
+    """Shared brush for label text of one palette color"""
+    return QBrush(get_color(color_key))
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_pen(edge_type):
+    """Shared pen for request (dashed) or assignment (solid) edges"""
+    if edge_type == 'request':
+        return QPen(get_color('edge_request'), 2, Qt.PenStyle.DashLine)
+    return QPen(get_color('edge_assignment'), 2, Qt.PenStyle.SolidLine)
+
+
+def _apply_node_style(node, color_key):
+    """
+    Color a node and its shadow
+    
+    Brushes and pens are shared between nodes of the same color, and the
+    shadow effect is created once per node and recolored afterwards.
+    
+    Args:
+        node: ProcessNode or ResourceNode
+        color_key: COLORS key of the fill color
+    """
+    brush, pen = _node_paint(color_key)
+    node.setBrush(brush)
+    node.setPen(pen)
+    
+    # Subtle shadow
+    shadow = node.graphicsEffect()
+    if shadow is None:
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setOffset(0, 2)
+        node.setGraphicsEffect(shadow)
+    shadow.setColor(get_color(color_key))
+    shadow.setBlurRadius(12 if node.is_deadlocked else 8)
 
 
 class ProcessNode(QGraphicsEllipseItem):
@@ -34,7 +78,10 @@ class ProcessNode(QGraphicsEllipseItem):
         self.pid = pid
         self.name = name
         self.radius = radius
+        # Distance from the center at which edges start/end
+        self.boundary = radius
         self.is_deadlocked = is_deadlocked
+        self.edges = set()  # Incident EdgeItems
         
         self.setPos(x, y)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
@@ -42,31 +89,24 @@ class ProcessNode(QGraphicsEllipseItem):
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CursorShape.OpenHandCursor)
         self.setZValue(10)
+        # Render shape, shadow and label to a pixmap once; moving the node
+        # then blits the pixmap instead of re-rasterizing the blur
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         self._setup_appearance()
         self._create_label()
         
     def _setup_appearance(self):
         """Setup node appearance with clean style"""
-        color = QColor(COLORS['deadlock'] if self.is_deadlocked else COLORS['node_process'])
-        
-        # Simple solid fill
-        self.setBrush(QBrush(color))
-        self.setPen(QPen(color.lighter(120), 2))
-        
-        # Subtle shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setColor(color)
-        shadow.setBlurRadius(12 if self.is_deadlocked else 8)
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+        _apply_node_style(self, 'deadlock' if self.is_deadlocked else 'node_process')
         
     def _create_label(self):
         """Create text label for the node"""
-        self.label = QGraphicsTextItem(self)
-        self.label.setPlainText(f"P{self.pid}")
+        # A simple text item draws the string directly, without the
+        # QTextDocument a QGraphicsTextItem carries
+        self.label = QGraphicsSimpleTextItem(f"P{self.pid}", self)
         self.label.setFont(get_font('body', bold=True))
-        self.label.setDefaultTextColor(QColor(COLORS['text_white']))
+        self.label.setBrush(_text_brush('text_white'))
         
         # Center the label
         rect = self.label.boundingRect()
@@ -82,8 +122,8 @@ class ProcessNode(QGraphicsEllipseItem):
         """Handle position changes for edge updates"""
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
             scene = self.scene()
-            if scene and hasattr(scene, 'update_edges'):
-                scene.update_edges()
+            if scene and hasattr(scene, 'node_moved'):
+                scene.node_moved(self)
         return super().itemChange(change, value)
         
     def hoverEnterEvent(self, event):
@@ -106,7 +146,9 @@ class ResourceNode(QGraphicsRectItem):
         self.total = total
         self.available = available
         self.size = size
+        self.boundary = half
         self.is_deadlocked = is_deadlocked
+        self.edges = set()  # Incident EdgeItems
         
         self.setPos(x, y)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
@@ -114,31 +156,20 @@ class ResourceNode(QGraphicsRectItem):
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CursorShape.OpenHandCursor)
         self.setZValue(10)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         self._setup_appearance()
         self._create_label()
         
     def _setup_appearance(self):
         """Setup node appearance with clean style"""
-        color = QColor(COLORS['deadlock'] if self.is_deadlocked else COLORS['node_resource'])
-        
-        # Simple solid fill
-        self.setBrush(QBrush(color))
-        self.setPen(QPen(color.lighter(120), 2))
-        
-        # Subtle shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setColor(color)
-        shadow.setBlurRadius(12 if self.is_deadlocked else 8)
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+        _apply_node_style(self, 'deadlock' if self.is_deadlocked else 'node_resource')
         
     def _create_label(self):
         """Create text label for the node"""
-        self.label = QGraphicsTextItem(self)
-        self.label.setPlainText(f"R{self.rid}\n{self.available}/{self.total}")
+        self.label = QGraphicsSimpleTextItem(f"R{self.rid}\n{self.available}/{self.total}", self)
         self.label.setFont(get_font('small', bold=True))
-        self.label.setDefaultTextColor(QColor(COLORS['text_white']))
+        self.label.setBrush(_text_brush('text_white'))
         
         # Center the label
         rect = self.label.boundingRect()
@@ -154,7 +185,7 @@ class ResourceNode(QGraphicsRectItem):
         """Update resource instance counts"""
         self.total = total
         self.available = available
-        self.label.setPlainText(f"R{self.rid}\n{self.available}/{self.total}")
+        self.label.setText(f"R{self.rid}\n{self.available}/{self.total}")
         rect = self.label.boundingRect()
         self.label.setPos(-rect.width() / 2, -rect.height() / 2)
             
@@ -162,8 +193,8 @@ class ResourceNode(QGraphicsRectItem):
         """Handle position changes for edge updates"""
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
             scene = self.scene()
-            if scene and hasattr(scene, 'update_edges'):
-                scene.update_edges()
+            if scene and hasattr(scene, 'node_moved'):
+                scene.node_moved(self)
         return super().itemChange(change, value)
         
     def hoverEnterEvent(self, event):
@@ -185,71 +216,75 @@ class EdgeItem(QGraphicsLineItem):
         self.edge_type = edge_type
         self.edge_label = label
         
+        from_node.edges.add(self)
+        to_node.edges.add(self)
+        
+        # Endpoint trim distances are fixed per node; look them up once
+        self._from_trim = getattr(from_node, 'boundary', 24)
+        self._to_trim = getattr(to_node, 'boundary', 24)
+        
         self.setZValue(5)
+        # Edges are not interactive; a press over one falls straight
+        # through to the scene (panning) instead of stopping at the line
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
         self._setup_appearance()
         self._create_label()
         self.update_position()
         
     def _setup_appearance(self):
         """Setup edge appearance based on type"""
-        if self.edge_type == 'request':
-            color = QColor(COLORS['edge_request'])
-            pen = QPen(color, 2, Qt.PenStyle.DashLine)
-        else:  # assignment
-            color = QColor(COLORS['edge_assignment'])
-            pen = QPen(color, 2, Qt.PenStyle.SolidLine)
-            
+        pen = _edge_pen(self.edge_type)
         self.setPen(pen)
-        self.color = color
+        self.color = pen.color()
         
     def _create_label(self):
         """Create label for the edge"""
-        self.label = QGraphicsTextItem(self)
-        self.label.setPlainText(self.edge_label)
+        self.label = QGraphicsSimpleTextItem(self.edge_label, self)
         self.label.setFont(get_font('tiny'))
-        self.label.setDefaultTextColor(self.color)
+        self.label.setBrush(QBrush(self.color))
+        
+        # Half extents used to center the label on the edge midpoint
+        rect = self.label.boundingRect()
+        self._label_offset = (rect.width() / 2, rect.height() / 2 + 10)
         
     def update_position(self):
         """Update edge position based on node positions"""
         if not self.from_node or not self.to_node:
             return
-            
-        start = self.from_node.scenePos()
-        end = self.to_node.scenePos()
         
-        # Calculate direction
-        dx = end.x() - start.x()
-        dy = end.y() - start.y()
-        length = math.sqrt(dx * dx + dy * dy)
+        # Nodes are top-level items, so pos() is their scene position
+        start = self.from_node.pos()
+        end = self.to_node.pos()
+        x1, y1 = start.x(), start.y()
+        x2, y2 = end.x(), end.y()
+        
+        dx = x2 - x1
+        dy = y2 - y1
+        length = math.hypot(dx, dy)
         
         if length < 1:
             return
-            
-        # Normalize
-        dx /= length
-        dy /= length
-        
-        # Get node radii
-        from_radius = getattr(self.from_node, 'radius', 24)
-        to_radius = getattr(self.to_node, 'radius', 24)
-        if hasattr(self.to_node, 'size'):
-            to_radius = self.to_node.size / 2
-        if hasattr(self.from_node, 'size'):
-            from_radius = self.from_node.size / 2
-        
-        # Adjust start and end points to node edges
-        start_x = start.x() + dx * from_radius
-        start_y = start.y() + dy * from_radius
-        end_x = end.x() - dx * to_radius
-        end_y = end.y() - dy * to_radius
+        
+        # Pull both ends back to the node boundaries (no trig needed:
+        # scaling the delta by trim/length gives the offset directly)
+        k1 = self._from_trim / length
+        k2 = self._to_trim / length
+        start_x = x1 + dx * k1
+        start_y = y1 + dy * k1
+        end_x = x2 - dx * k2
+        end_y = y2 - dy * k2
         
         self.setLine(start_x, start_y, end_x, end_y)
         
         # Position label at midpoint
-        mid_x = (start_x + end_x) / 2
-        mid_y = (start_y + end_y) / 2 - 10
-        rect = self.label.boundingRect()
-        self.label.setPos(mid_x - rect.width() / 2, mid_y - rect.height() / 2)
+        if self.edge_label:
+            half_w, half_h = self._label_offset
+            self.label.setPos((start_x + end_x) / 2 - half_w, (start_y + end_y) / 2 - half_h)
+        
+    def detach(self):
+        """Unregister from both endpoint nodes before the edge is removed"""
+        self.from_node.edges.discard(self)
+        self.to_node.edges.discard(self)
         
     def _draw_arrow_head(self, x, y, dx, dy):
         """Draw arrow head at the end of the edge"""
@@ -263,21 +298,57 @@ class RAGScene(QGraphicsScene):
         super().__init__()
         self.process_nodes = {}  # pid -> ProcessNode
         self.resource_nodes = {}  # rid -> ResourceNode
-        self.edges = []  # List of EdgeItem
+        self.edges = {}  # (edge type, from id, to id) -> EdgeItem
         
-        self.setBackgroundBrush(QBrush(QColor(COLORS['bg_primary'])))
+        # Set while many nodes move at once; edges are updated once after
+        self.deferring_edges = False
+        # Nodes moved since the last edge update
+        self._moved_nodes = set()
+        
+        self.setBackgroundBrush(QBrush(get_color('bg_primary')))
         
     def update_edges(self):
         """Update all edge positions"""
-        for edge in self.edges:
+        if self.deferring_edges:
+            return
+        for edge in self.edges.values():
             edge.update_position()
             
+    def node_moved(self, node):
+        """
+        Queue the edges attached to a moved node for repositioning
+        
+        Args:
+            node: ProcessNode or ResourceNode whose position changed
+        """
+        if self.deferring_edges:
+            return
+        self._moved_nodes.add(node)
+        self._flush_moved_edges()
+        
+    @throttle(16)
+    def _flush_moved_edges(self):
+        """
+        Reposition the edges of moved nodes, at most once per frame
+        
+        A drag moves its node on every mouse event, often faster than the
+        screen refreshes; only the dragged node's own edges follow, once
+        per ~16 ms.
+        """
+        moved, self._moved_nodes = self._moved_nodes, set()
+        edges = set()
+        for node in moved:
+            edges.update(node.edges)
+        for edge in edges:
+            edge.update_position()
+        
     def clear_all(self):
         """Clear all nodes and edges"""
         self.clear()
         self.process_nodes = {}
         self.resource_nodes = {}
-        self.edges = []
+        self.edges = {}
+        self._moved_nodes = set()
 
 
 class RAGVisualizer(QWidget):
@@ -296,11 +367,33 @@ class RAGVisualizer(QWidget):
         self.assignments = []
         self.deadlocked_processes = set()
         self.deadlocked_resources = set()
+        # Nodes and edges of the graph last laid out; a refresh that leaves
+        # them unchanged only restyles the existing items
+        self._topology = None
+        
+        # Payloads behind the current drawing (cached responses are shared,
+        # so an identical object means an unchanged result)
+        self._state = None
+        self._detection = None
+        
+        # (process ids, resource ids, layout nodes, layout edges) for the
+        # current topology; see _build_graph()
+        self._graph = ([], [], [], [])
+        
+        # Bumped per relayout so results of superseded layouts are dropped
+        self._layout_seq = 0
         
         # Layout
         self.layout_algo = GraphLayout(width=800, height=600)
         self.current_layout = 'force'
         
+        # Debounces relayout while the widget is being resized; each
+        # resize event restarts it, so only the final size is laid out
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._relayout)
+        
         self._setup_ui()
         
     def _setup_ui(self):
@@ -332,12 +425,7 @@ class RAGVisualizer(QWidget):
     def _create_toolbar(self):
         """Create the toolbar with layout options"""
         toolbar = QFrame()
-        toolbar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['bg_secondary']};
-                border-radius: 8px;
-            }}
-        """)
+        toolbar.setProperty("card", True)
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(16, 10, 16, 10)
         toolbar_layout.setSpacing(12)
@@ -359,31 +447,7 @@ class RAGVisualizer(QWidget):
         for text, value in layouts:
             radio = QRadioButton(text)
             radio.setProperty("layout_value", value)
-            radio.setStyleSheet(f"""
-                QRadioButton {{
-                    color: {COLORS['text_secondary']};
-                    spacing: 6px;
-                    padding: 6px 12px;
-                    background-color: {COLORS['bg_tertiary']};
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 6px;
-                }}
-                QRadioButton::indicator {{
-                    width: 12px;
-                    height: 12px;
-                    border-radius: 6px;
-                    border: 2px solid {COLORS['border_light']};
-                    background-color: transparent;
-                }}
-                QRadioButton::indicator:checked {{
-                    background-color: {COLORS['primary']};
-                    border-color: {COLORS['primary']};
-                }}
-                QRadioButton:hover {{
-                    color: {COLORS['text_primary']};
-                    border-color: {COLORS['primary']};
-                }}
-            """)
+            radio.setProperty("segment", True)
             if value == 'force':
                 radio.setChecked(True)
             radio.toggled.connect(self._on_layout_changed)
@@ -392,61 +456,29 @@ class RAGVisualizer(QWidget):
             
         toolbar_layout.addStretch()
         
-        # Button style for toolbar - consistent height
-        btn_style = f"""
-            QPushButton {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['text_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-                padding: 6px 14px;
-                font-weight: 500;
-                min-height: 18px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_hover']};
-                color: {COLORS['text_primary']};
-                border-color: {COLORS['primary']};
-            }}
-        """
+        # Toolbar buttons are styled by the theme's QPushButton[toolbar="true"] rules
         
         # Refresh button
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setStyleSheet(btn_style)
+        refresh_btn.setProperty("toolbar", True)
         refresh_btn.clicked.connect(self.refresh)
         toolbar_layout.addWidget(refresh_btn)
         
         # Zoom buttons - same style but narrower
-        zoom_btn_style = f"""
-            QPushButton {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['text_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-weight: 600;
-                min-height: 18px;
-                min-width: 28px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_hover']};
-                color: {COLORS['text_primary']};
-                border-color: {COLORS['primary']};
-            }}
-        """
-        
         zoom_in_btn = QPushButton("+")
-        zoom_in_btn.setStyleSheet(zoom_btn_style)
+        zoom_in_btn.setProperty("toolbar", True)
+        zoom_in_btn.setProperty("zoom", True)
         zoom_in_btn.clicked.connect(lambda: self.view.scale(1.2, 1.2))
         toolbar_layout.addWidget(zoom_in_btn)
         
         zoom_out_btn = QPushButton("−")
-        zoom_out_btn.setStyleSheet(zoom_btn_style)
+        zoom_out_btn.setProperty("toolbar", True)
+        zoom_out_btn.setProperty("zoom", True)
         zoom_out_btn.clicked.connect(lambda: self.view.scale(1/1.2, 1/1.2))
         toolbar_layout.addWidget(zoom_out_btn)
         
         reset_btn = QPushButton("Fit")
-        reset_btn.setStyleSheet(btn_style)
+        reset_btn.setProperty("toolbar", True)
         reset_btn.clicked.connect(self._fit_view)
         toolbar_layout.addWidget(reset_btn)
         
@@ -455,17 +487,13 @@ class RAGVisualizer(QWidget):
     def _create_legend(self):
         """Create the legend"""
         legend = QFrame()
-        legend.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['bg_secondary']};
-                border-radius: 8px;
-            }}
-        """)
+        legend.setProperty("card", True)
         legend_layout = QHBoxLayout(legend)
         legend_layout.setContentsMargins(16, 10, 16, 10)
         legend_layout.setSpacing(24)
         
-        # Legend items
+        # One rich-text label renders every entry, instead of a pair of
+        # separately styled labels per entry
         items = [
             ("●", COLORS['node_process'], "Process"),
             ("■", COLORS['node_resource'], "Resource"),
@@ -473,21 +501,14 @@ class RAGVisualizer(QWidget):
             ("—", COLORS['edge_assignment'], "Allocated"),
             ("●", COLORS['deadlock'], "Deadlocked"),
         ]
-        
-        for symbol, color, text in items:
-            item_layout = QHBoxLayout()
-            item_layout.setSpacing(6)
-            
-            symbol_label = QLabel(symbol)
-            symbol_label.setStyleSheet(f"color: {color}; font-size: 12pt; font-weight: bold;")
-            item_layout.addWidget(symbol_label)
-            
-            text_label = QLabel(text)
-            text_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 9pt;")
-            item_layout.addWidget(text_label)
-            
-            legend_layout.addLayout(item_layout)
-            
+        spacer = "&nbsp;" * 6
+        legend_label = QLabel(spacer.join(
+            f'<span style="color: {color}; font-size: 12pt; font-weight: bold;">{symbol}</span>'
+            f'&nbsp;&nbsp;<span style="color: {COLORS["text_muted"]}; font-size: 9pt;">{text}</span>'
+            for symbol, color, text in items
+        ))
+        legend_label.setTextFormat(Qt.TextFormat.RichText)
+        legend_layout.addWidget(legend_label)
         legend_layout.addStretch()
         
         return legend
@@ -505,132 +526,222 @@ class RAGVisualizer(QWidget):
         self.view.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
         
     def refresh(self):
-        """Refresh RAG data from backend"""
+        """
+        Refresh RAG data from backend
+        
+        Query results are cached per backend generation, so an unchanged
+        graph hands back the very same payloads; in that case nothing on
+        screen can have changed and the refresh stops there.
+        """
         try:
             response = self.backend.rag_get_state()
             if response and response.get('status') == 'success':
-                data = response.get('data', {})
-                if isinstance(data, str):
-                    import json
-                    data = json.loads(data)
-                
-                self.processes = data.get('processes', [])
-                self.resources = data.get('resources', [])
-                self.requests = [(r['process'], r['resource']) 
-                               for r in data.get('requests', [])]
-                self.assignments = [(a['resource'], a['process'], a.get('count', 1))
-                                  for a in data.get('assignments', [])]
+                # The backend interface decodes responses, so data is already a dict
+                data = response.get('data') or {}
+                state_changed = data is not self._state
+                if state_changed:
+                    self._state = data
+                    self.processes = data.get('processes', [])
+                    self.resources = data.get('resources', [])
+                    self.requests = [(r['process'], r['resource']) 
+                                   for r in data.get('requests', [])]
+                    self.assignments = [(a['resource'], a['process'], a.get('count', 1))
+                                      for a in data.get('assignments', [])]
                 
                 # Get deadlock status
+                highlights_changed = False
                 try:
                     det_response = self.backend.detect_deadlock()
                     if det_response and det_response.get('status') == 'success':
-                        det_data = det_response.get('data', {})
-                        if isinstance(det_data, str):
-                            import json
-                            det_data = json.loads(det_data)
-                        
-                        self.deadlocked_processes = set(det_data.get('deadlocked_processes', []))
-                        self.deadlocked_resources = set(det_data.get('deadlocked_resources', []))
+                        det_data = det_response.get('data') or {}
+                        highlights_changed = det_data is not self._detection
+                        if highlights_changed:
+                            self._detection = det_data
+                            self.deadlocked_processes = set(det_data.get('deadlocked_processes', []))
+                            self.deadlocked_resources = set(det_data.get('deadlocked_resources', []))
                 except:
                     pass
                 
-                self._relayout()
+                if not (state_changed or highlights_changed):
+                    return
+                
+                topology = (
+                    tuple(p['id'] for p in self.processes),
+                    tuple(r['id'] for r in self.resources),
+                    frozenset(self.requests),
+                    frozenset(self.assignments),
+                )
+                if topology == self._topology:
+                    self._restyle()
+                else:
+                    self._topology = topology
+                    self._graph = self._build_graph()
+                    self._relayout()
                 
         except Exception as e:
             print(f"Error refreshing RAG: {e}")
             
-    def _relayout(self):
-        """Recalculate positions and redraw"""
-        # Update layout dimensions
-        self.layout_algo.width = self.view.width() - 40
-        self.layout_algo.height = self.view.height() - 40
+    def _build_graph(self):
+        """
+        Build the node and edge lists the layouts work on
         
-        # Prepare node lists
+        Returns:
+            (process ids, resource ids, node ids, (source, target) edges)
+        """
         process_ids = [p['id'] for p in self.processes]
         resource_ids = [r['id'] for r in self.resources]
         all_nodes = [('P', pid) for pid in process_ids] + [('R', rid) for rid in resource_ids]
         
+        edges = [(('P', pid), ('R', rid)) for pid, rid in self.requests]
+        edges += [(('R', rid), ('P', pid)) for rid, pid, _ in self.assignments]
+        return process_ids, resource_ids, all_nodes, edges
+        
+    def _restyle(self):
+        """Update deadlock highlighting and resource counts in place"""
+        deadlocked = self.deadlocked_processes
+        for pid, node in self.scene.process_nodes.items():
+            node.set_deadlocked(pid in deadlocked)
+        
+        deadlocked = self.deadlocked_resources
+        nodes = self.scene.resource_nodes
+        for resource in self.resources:
+            node = nodes.get(resource['id'])
+            if node is None:
+                continue
+            node.set_deadlocked(resource['id'] in deadlocked)
+            total = resource['total_instances']
+            available = resource['available_instances']
+            if (node.total, node.available) != (total, available):
+                node.update_info(total, available)
+        
+    @async_handler
+    async def _relayout(self):
+        """
+        Recalculate positions and redraw
+        
+        The force-directed layout runs on a worker thread and the current
+        drawing stays interactive meanwhile. A relayout started before it
+        finishes supersedes it, and the stale result is dropped.
+        """
+        self._layout_seq += 1
+        seq = self._layout_seq
+        
+        # Update layout dimensions
+        self.layout_algo.width = self.view.width() - 40
+        self.layout_algo.height = self.view.height() - 40
+        
+        # Node and edge lists are rebuilt only when the topology changes
+        process_ids, resource_ids, all_nodes, edges = self._graph
+        
         if not all_nodes:
             self.scene.clear_all()
             return
         
-        # Prepare edges
-        edges = []
-        for pid, rid in self.requests:
-            edges.append((('P', pid), ('R', rid)))
-        for rid, pid, _ in self.assignments:
-            edges.append((('R', rid), ('P', pid)))
-        
         # Calculate positions
         if self.current_layout == 'circular':
             positions = self.layout_algo.circular_layout(all_nodes)
         elif self.current_layout == 'hierarchical':
             positions = self.layout_algo.hierarchical_layout(process_ids, resource_ids)
         else:
-            positions = self.layout_algo.force_directed_layout(all_nodes, edges, iterations=50)
+            # Run on a snapshot so a resize cannot change the size mid-run
+            layout = GraphLayout(self.layout_algo.width, self.layout_algo.height)
+            positions = await run_blocking(layout.force_directed_layout, all_nodes, edges, 50)
+            if seq != self._layout_seq:
+                return
         
         # Redraw
         self._draw_graph(positions)
         
     def _draw_graph(self, positions):
-        """Draw the graph with the calculated positions"""
-        self.scene.clear_all()
-        
-        # Create process nodes
-        for process in self.processes:
-            pid = process['id']
-            node_id = ('P', pid)
-            if node_id in positions:
+        """
+        Place the graph items at the calculated positions
+        
+        Items persist across refreshes, matched by id: existing nodes and
+        edges are moved and restyled in place, new ones are created and
+        vanished ones removed, so an unchanged graph creates no items.
+        """
+        scene = self.scene
+        scene.deferring_edges = True
+        try:
+            # Process nodes
+            nodes = {}
+            for process in self.processes:
+                pid = process['id']
+                node_id = ('P', pid)
+                if node_id not in positions:
+                    continue
                 x, y = positions[node_id]
                 is_deadlocked = pid in self.deadlocked_processes
-                node = ProcessNode(pid, process['name'], x, y, is_deadlocked=is_deadlocked)
-                self.scene.addItem(node)
-                self.scene.process_nodes[pid] = node
-        
-        # Create resource nodes
-        for resource in self.resources:
-            rid = resource['id']
-            node_id = ('R', rid)
-            if node_id in positions:
+                node = scene.process_nodes.pop(pid, None)
+                if node is None:
+                    node = ProcessNode(pid, process['name'], x, y, is_deadlocked=is_deadlocked)
+                    scene.addItem(node)
+                else:
+                    node.name = process['name']
+                    node.setPos(x, y)
+                    node.set_deadlocked(is_deadlocked)
+                nodes[pid] = node
+            for node in scene.process_nodes.values():
+                scene.removeItem(node)
+            scene.process_nodes = nodes
+            
+            # Resource nodes
+            nodes = {}
+            for resource in self.resources:
+                rid = resource['id']
+                node_id = ('R', rid)
+                if node_id not in positions:
+                    continue
                 x, y = positions[node_id]
                 is_deadlocked = rid in self.deadlocked_resources
-                node = ResourceNode(
-                    rid, resource['name'],
-                    resource['total_instances'],
-                    resource['available_instances'],
-                    x, y, is_deadlocked=is_deadlocked
-                )
-                self.scene.addItem(node)
-                self.scene.resource_nodes[rid] = node
-        
-        # Create edges
-        for pid, rid in self.requests:
-            if pid in self.scene.process_nodes and rid in self.scene.resource_nodes:
-                edge = EdgeItem(
-                    self.scene.process_nodes[pid],
-                    self.scene.resource_nodes[rid],
-                    'request', ''
-                )
-                self.scene.addItem(edge)
-                self.scene.edges.append(edge)
-        
-        for rid, pid, count in self.assignments:
-            if pid in self.scene.process_nodes and rid in self.scene.resource_nodes:
-                edge = EdgeItem(
-                    self.scene.resource_nodes[rid],
-                    self.scene.process_nodes[pid],
-                    'assignment', ''
-                )
-                self.scene.addItem(edge)
-                self.scene.edges.append(edge)
+                total = resource['total_instances']
+                available = resource['available_instances']
+                node = scene.resource_nodes.pop(rid, None)
+                if node is None:
+                    node = ResourceNode(rid, resource['name'], total, available,
+                                        x, y, is_deadlocked=is_deadlocked)
+                    scene.addItem(node)
+                else:
+                    node.name = resource['name']
+                    node.setPos(x, y)
+                    node.set_deadlocked(is_deadlocked)
+                    if (node.total, node.available) != (total, available):
+                        node.update_info(total, available)
+                nodes[rid] = node
+            for node in scene.resource_nodes.values():
+                scene.removeItem(node)
+            scene.resource_nodes = nodes
+            
+            # Edges (both endpoints are kept nodes, so kept edges stay attached)
+            process_nodes = scene.process_nodes
+            resource_nodes = scene.resource_nodes
+            wanted = [(('request', pid, rid), process_nodes.get(pid), resource_nodes.get(rid))
+                      for pid, rid in self.requests]
+            wanted += [(('assignment', rid, pid), resource_nodes.get(rid), process_nodes.get(pid))
+                       for rid, pid, _ in self.assignments]
+            
+            edges = {}
+            for key, from_node, to_node in wanted:
+                if from_node is None or to_node is None or key in edges:
+                    continue
+                edge = scene.edges.pop(key, None)
+                if edge is None:
+                    edge = EdgeItem(from_node, to_node, key[0], '')
+                    scene.addItem(edge)
+                edges[key] = edge
+            for edge in scene.edges.values():
+                edge.detach()
+                scene.removeItem(edge)
+            scene.edges = edges
+        finally:
+            scene.deferring_edges = False
+        scene.update_edges()
         
         # Fit view
-        self.scene.setSceneRect(self.scene.itemsBoundingRect().adjusted(-50, -50, 50, 50))
+        scene.setSceneRect(scene.itemsBoundingRect().adjusted(-50, -50, 50, 50))
         
     def resizeEvent(self, event):
         """Handle resize to update layout dimensions"""
         super().resizeEvent(event)
         if self.processes or self.resources:
-            # Delay relayout to avoid excessive recalculations
-            QTimer.singleShot(100, self._relayout)
+            self._resize_timer.start()
@@ -10,11 +10,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import pyqtSignal
 
-import sys
-import os
 import json
 from datetime import datetime
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.theme_qt import COLORS, get_font
 
@@ -80,12 +77,13 @@ class SimulationPanel(QWidget):
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
         self.log_text.setMinimumHeight(120)
         log_layout.addWidget(self.log_text)
         
         clear_btn = QPushButton("Clear Log")
         clear_btn.setProperty("secondary", True)
-        clear_btn.clicked.connect(lambda: self.log_text.clear())
+        clear_btn.clicked.connect(self.log_text.clear)
         log_layout.addWidget(clear_btn)
         
         layout.addWidget(log_group)
@@ -138,6 +136,8 @@ class SimulationPanel(QWidget):
                     self._log(f"Step {tick}: Completed")
                 
                 self.updated.emit()
+            elif response is None:
+                QMessageBox.warning(self, "Error", "Backend not responding")
             else:
                 QMessageBox.warning(self, "Error",
                     f"Failed: {response.get('message', 'Unknown error')}")
@@ -81,12 +81,24 @@ class GraphLayout:
             area = (self.width - 2 * self.margin) * (self.height - 2 * self.margin)
             k = math.sqrt(area / n)
         
+        # Work on flat coordinate lists indexed by node position; the loops
+        # below then index lists instead of hashing node-id tuples
+        index = {node_id: i for i, node_id in enumerate(nodes)}
+        links = [(index[source], index[target]) for source, target in edges
+                 if source in index and target in index]
+        
         # Initialize positions randomly
-        positions = {}
-        for node_id in nodes:
-            x = random.uniform(self.margin, self.width - self.margin)
-            y = random.uniform(self.margin, self.height - self.margin)
-            positions[node_id] = [x, y]
+        xs = []
+        ys = []
+        for _ in nodes:
+            xs.append(random.uniform(self.margin, self.width - self.margin))
+            ys.append(random.uniform(self.margin, self.height - self.margin))
+        
+        min_x, max_x = self.margin, self.width - self.margin
+        min_y, max_y = self.margin, self.height - self.margin
+        
+        k_sq = k * k
+        inv_k = 1 / k
         
         # Initial temperature
         t = self.width / 10
@@ -94,65 +106,72 @@ class GraphLayout:
         
         for iteration in range(iterations):
             # Calculate repulsive forces
-            displacements = {node_id: [0.0, 0.0] for node_id in nodes}
+            disp_x = [0.0] * n
+            disp_y = [0.0] * n
             
-            # Repulsion between all pairs
-            for i, v in enumerate(nodes):
-                for w in nodes[i + 1:]:
-                    delta_x = positions[v][0] - positions[w][0]
-                    delta_y = positions[v][1] - positions[w][1]
-                    distance = math.sqrt(delta_x ** 2 + delta_y ** 2)
+            # Repulsion between all pairs. The force k^2/d along the unit
+            # vector delta/d is delta * k^2/d^2, so the O(n^2) loop needs
+            # neither a square root nor per-component divisions
+            for i in range(n):
+                xi = xs[i]
+                yi = ys[i]
+                for j in range(i + 1, n):
+                    delta_x = xi - xs[j]
+                    delta_y = yi - ys[j]
+                    distance_sq = delta_x * delta_x + delta_y * delta_y
                     
-                    if distance < 0.01:
-                        distance = 0.01
+                    if distance_sq < 0.0001:
+                        distance_sq = 0.0001
                     
                     # Repulsive force
-                    fr = k * k / distance
+                    fr = k_sq / distance_sq
                     
-                    displacements[v][0] += (delta_x / distance) * fr
-                    displacements[v][1] += (delta_y / distance) * fr
-                    displacements[w][0] -= (delta_x / distance) * fr
-                    displacements[w][1] -= (delta_y / distance) * fr
+                    fx = delta_x * fr
+                    fy = delta_y * fr
+                    disp_x[i] += fx
+                    disp_y[i] += fy
+                    disp_x[j] -= fx
+                    disp_y[j] -= fy
             
             # Attractive forces along edges
-            for source, target in edges:
-                if source not in positions or target not in positions:
-                    continue
-                
-                delta_x = positions[source][0] - positions[target][0]
-                delta_y = positions[source][1] - positions[target][1]
-                distance = math.sqrt(delta_x ** 2 + delta_y ** 2)
+            for source, target in links:
+                delta_x = xs[source] - xs[target]
+                delta_y = ys[source] - ys[target]
+                distance = math.sqrt(delta_x * delta_x + delta_y * delta_y)
                 
                 if distance < 0.01:
                     distance = 0.01
                 
-                # Attractive force
-                fa = distance * distance / k
+                # Attractive force d^2/k along delta/d is delta * d/k
+                fa = distance * inv_k
                 
-                displacements[source][0] -= (delta_x / distance) * fa
-                displacements[source][1] -= (delta_y / distance) * fa
-                displacements[target][0] += (delta_x / distance) * fa
-                displacements[target][1] += (delta_y / distance) * fa
+                fx = delta_x * fa
+                fy = delta_y * fa
+                disp_x[source] -= fx
+                disp_y[source] -= fy
+                disp_x[target] += fx
+                disp_y[target] += fy
             
             # Limit max displacement to temperature t and prevent from being displaced outside frame
-            for node_id in nodes:
-                dx = displacements[node_id][0]
-                dy = displacements[node_id][1]
+            for i in range(n):
+                dx = disp_x[i]
+                dy = disp_y[i]
                 disp = math.sqrt(dx ** 2 + dy ** 2)
                 
+                x = xs[i]
+                y = ys[i]
                 if disp > 0.01:
-                    positions[node_id][0] += (dx / disp) * min(disp, t)
-                    positions[node_id][1] += (dy / disp) * min(disp, t)
+                    x += (dx / disp) * min(disp, t)
+                    y += (dy / disp) * min(disp, t)
                 
                 # Keep within bounds
-                positions[node_id][0] = max(self.margin, min(self.width - self.margin, positions[node_id][0]))
-                positions[node_id][1] = max(self.margin, min(self.height - self.margin, positions[node_id][1]))
+                xs[i] = max(min_x, min(max_x, x))
+                ys[i] = max(min_y, min(max_y, y))
             
             # Reduce temperature
             t -= dt
         
-        # Convert to tuples
-        return {node_id: tuple(pos) for node_id, pos in positions.items()}
+        return {node_id: (xs[i], ys[i]) for node_id, i in index.items()}
     
     def hierarchical_layout(self, processes, resources):
         """
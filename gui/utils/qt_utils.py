@@ -0,0 +1,253 @@
+"""
+Qt Helper Utilities
+
+Small helpers shared by the GUI components for scheduling work on the
+Qt event loop, running blocking backend calls off the GUI thread, and
+writing handlers as asyncio coroutines.
+"""
+
+import asyncio
+import functools
+import logging
+from contextlib import contextmanager
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer
+from PyQt6.QtWidgets import QHeaderView, QWidget
+
+
+log = logging.getLogger(__name__)
+
+
+def throttle(interval_ms):
+    """
+    Coalesce bursts of calls to a no-argument method into one trailing call
+
+    The first call schedules the method to run after interval_ms; further
+    calls before it runs are dropped. Signal arguments (e.g. the checked
+    flag of clicked()) are ignored, so decorated methods can be connected
+    to signals directly.
+
+    Args:
+        interval_ms: Delay in milliseconds before the trailing call
+    """
+    def decorator(method):
+        flag = f"_{method.__name__}_pending"
+
+        @functools.wraps(method)
+        def wrapper(self, *_):
+            if getattr(self, flag, False):
+                return
+            setattr(self, flag, True)
+
+            def run():
+                # The widget may have been deleted while the timer was pending
+                if sip.isdeleted(self):
+                    return
+                setattr(self, flag, False)
+                method(self)
+
+            QTimer.singleShot(interval_ms, run)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def bulk_update(view):
+    """
+    Suspend repaints, header stretching and row banding while a view's model is updated
+    
+    A stretched header redistributes column widths on every row insert,
+    and alternating row colors re-band every row below a change; pausing
+    both for the duration of the update leaves one layout pass and one
+    repaint at the end.
+    
+    Args:
+        view: QTableView whose model is about to change
+    """
+    header = view.horizontalHeader()
+    mode = header.sectionResizeMode(0)
+    alternating = view.alternatingRowColors()
+    view.setUpdatesEnabled(False)
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.setAlternatingRowColors(False)
+    try:
+        yield view
+    finally:
+        view.setAlternatingRowColors(alternating)
+        header.setSectionResizeMode(mode)
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+def set_style_property(widget, name, value):
+    """
+    Change a dynamic property used by stylesheet selectors and restyle
+    
+    Qt only re-matches selectors when a widget is polished, so the widget
+    and its descendants (for rules like ``QFrame[status="safe"] QLabel``)
+    are re-polished. Setting the value the property already has is free.
+    
+    Args:
+        widget: Widget to update
+        name: Property name
+        value: New property value
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    for target in (widget, *widget.findChildren(QWidget)):
+        style.unpolish(target)
+        style.polish(target)
+
+
+class AsyncioPump(QObject):
+    """
+    Drive an asyncio event loop from the Qt event loop
+    
+    A timer periodically runs one pass of the asyncio loop on the GUI
+    thread, so coroutines and widgets share that thread. The pump polls
+    quickly while tasks are in flight and backs off when the loop is idle.
+    """
+    
+    def __init__(self, busy_ms=5, idle_ms=50, parent=None):
+        """
+        Initialize the pump
+        
+        Args:
+            busy_ms: Poll interval while tasks are pending
+            idle_ms: Poll interval while the loop is idle
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self._busy_ms = busy_ms
+        self._idle_ms = idle_ms
+        
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._step)
+        self._timer.start(idle_ms)
+        
+    def create_task(self, coro):
+        """
+        Schedule a coroutine on the pumped loop
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            asyncio.Task
+        """
+        task = self.loop.create_task(coro)
+        self._timer.setInterval(self._busy_ms)
+        return task
+        
+    def _step(self):
+        """Run the callbacks that are ready, then re-arm for the next pass"""
+        loop = self.loop
+        # A modal dialog opened from a coroutine spins a nested Qt loop
+        # while this loop is still running; wait until it returns
+        if loop.is_running():
+            return
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        
+        busy = any(not task.done() for task in asyncio.all_tasks(loop))
+        self._timer.setInterval(self._busy_ms if busy else self._idle_ms)
+
+
+_pump = None
+
+
+def get_asyncio_pump():
+    """Return the application-wide asyncio pump, creating it on first use"""
+    global _pump
+    if _pump is None:
+        _pump = AsyncioPump()
+    return _pump
+
+
+class _BlockingCall(QRunnable):
+    """QRunnable that settles an asyncio future with the result of a call"""
+    
+    def __init__(self, loop, future, fn, args):
+        super().__init__()
+        self._loop = loop
+        self._future = future
+        self._fn = fn
+        self._args = args
+        
+    def run(self):
+        if self._future.cancelled():
+            return
+        try:
+            settle, value = _set_result, self._fn(*self._args)
+        except Exception as e:
+            settle, value = _set_exception, e
+        try:
+            self._loop.call_soon_threadsafe(settle, self._future, value)
+        except RuntimeError:
+            # The loop was closed while the call was running
+            pass
+
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _set_exception(future, error):
+    if not future.done():
+        future.set_exception(error)
+
+
+def run_blocking(fn, *args):
+    """
+    Await a blocking call run on Qt's global thread pool
+    
+    The call runs on a QThreadPool worker and the awaiting coroutine
+    resumes on the GUI thread, so code after the await may touch widgets.
+    
+    Args:
+        fn: Blocking callable (e.g. a BackendInterface command)
+        
+    Returns:
+        Awaitable resolving to fn(*args)
+    """
+    loop = get_asyncio_pump().loop
+    future = loop.create_future()
+    QThreadPool.globalInstance().start(_BlockingCall(loop, future, fn, args))
+    return future
+
+
+def _report_task_error(task):
+    """Log the exception of a failed handler task"""
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Unhandled error in async handler", exc_info=task.exception())
+
+
+def async_handler(method):
+    """
+    Turn an ``async def`` method into a slot that schedules it on the pump
+    
+    Signal arguments are ignored, as with throttle(). Tasks still running
+    when the widget is deleted are cancelled, so code after an await never
+    touches a dead widget.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *_):
+        tasks = self.__dict__.get('_async_tasks')
+        if tasks is None:
+            tasks = self._async_tasks = set()
+            self.destroyed.connect(lambda: [task.cancel() for task in list(tasks)])
+        
+        task = get_asyncio_pump().create_task(method(self))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(_report_task_error)
+        return task
+    
+    return wrapper
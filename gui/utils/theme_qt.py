@@ -4,6 +4,8 @@ Theme and Styling for OS-EL Deadlock Detection GUI (PyQt6)
 Provides a minimal, professional dark theme with clean aesthetics.
 """
 
+import functools
+
 from PyQt6.QtGui import QColor, QFont, QPalette
 from PyQt6.QtWidgets import QApplication
 
@@ -95,8 +97,14 @@ FONTS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_font(size='body', bold=False, mono=False):
-    """Get a QFont with the specified parameters"""
+    """
+    Get a QFont with the specified parameters
+    
+    Fonts are built once per combination and shared; setFont() copies
+    the font, so callers must not modify the returned object.
+    """
     family = FONTS['family_mono'] if mono else FONTS['family']
     
     # Size mapping
@@ -118,6 +126,20 @@ def get_font(size='body', bold=False, mono=False):
     return font
 
 
+@functools.lru_cache(maxsize=None)
+def get_color(name):
+    """
+    Get the shared QColor for a palette entry
+    
+    Args:
+        name: Key in COLORS
+        
+    Returns:
+        QColor (shared; callers must not modify it)
+    """
+    return QColor(COLORS[name])
+
+
 # ============================================================================
 # Stylesheet - Minimal Professional Dark Theme
 # ============================================================================
@@ -183,6 +205,38 @@ QLabel[heading="true"] {{
     color: {COLORS['text_primary']};
 }}
 
+QLabel[role="field"] {{
+    color: {COLORS['text_secondary']};
+    font-weight: 500;
+}}
+
+/* Result output labels, colored by outcome (deadlock panel) */
+QLabel[role="output"] {{
+    background-color: {COLORS['bg_input']};
+    color: {COLORS['text_primary']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 6px;
+    padding: 10px;
+    font-family: '{FONTS['family_mono']}';
+    font-size: {FONTS['size_small']}pt;
+}}
+
+QLabel[role="output"][tone="muted"] {{
+    color: {COLORS['text_muted']};
+}}
+
+QLabel[role="output"][tone="error"] {{
+    color: {COLORS['error']};
+}}
+
+QLabel[role="output"][tone="success"] {{
+    color: {COLORS['success']};
+}}
+
+QLabel[role="output"][tone="warning"] {{
+    color: {COLORS['warning']};
+}}
+
 /* Push Buttons - Clean minimal style */
 QPushButton {{
     background-color: {COLORS['primary']};
@@ -235,6 +289,61 @@ QPushButton[success="true"]:hover {{
     background-color: #388e3c;
 }}
 
+/* Card frames (graph toolbar and legend) */
+QFrame[card="true"] {{
+    background-color: {COLORS['bg_secondary']};
+    border-radius: 8px;
+}}
+
+/* Deadlock status indicator */
+QFrame[status="deadlock"] {{
+    background-color: {COLORS['error']};
+    border-radius: 6px;
+}}
+
+QFrame[status="safe"] {{
+    background-color: {COLORS['success']};
+    border-radius: 6px;
+}}
+
+QFrame[status="unknown"] {{
+    background-color: {COLORS['bg_tertiary']};
+    border-radius: 6px;
+}}
+
+QFrame[status="deadlock"] QLabel, QFrame[status="safe"] QLabel {{
+    color: white;
+    background: transparent;
+}}
+
+QFrame[status="unknown"] QLabel {{
+    color: {COLORS['text_muted']};
+    background: transparent;
+}}
+
+/* Toolbar buttons (graph view) */
+QPushButton[toolbar="true"] {{
+    background-color: {COLORS['bg_tertiary']};
+    color: {COLORS['text_secondary']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 6px;
+    padding: 6px 14px;
+    font-weight: 500;
+    min-height: 18px;
+}}
+
+QPushButton[toolbar="true"]:hover {{
+    background-color: {COLORS['bg_hover']};
+    color: {COLORS['text_primary']};
+    border-color: {COLORS['primary']};
+}}
+
+QPushButton[toolbar="true"][zoom="true"] {{
+    padding: 6px 10px;
+    font-weight: 600;
+    min-width: 28px;
+}}
+
 /* Line Edit - Clean input style */
 QLineEdit {{
     background-color: {COLORS['bg_input']};
@@ -411,17 +520,17 @@ QTableWidget, QTreeWidget, QTableView, QTreeView {{
     selection-background-color: {COLORS['primary']};
 }}
 
-QTableWidget::item, QTreeWidget::item {{
+QTableWidget::item, QTableView::item, QTreeWidget::item {{
     padding: 8px 12px;
     border-bottom: 1px solid {COLORS['border']};
 }}
 
-QTableWidget::item:selected, QTreeWidget::item:selected {{
+QTableWidget::item:selected, QTableView::item:selected, QTreeWidget::item:selected {{
     background-color: {COLORS['primary']};
     color: {COLORS['text_white']};
 }}
 
-QTableWidget::item:hover, QTreeWidget::item:hover {{
+QTableWidget::item:hover, QTableView::item:hover, QTreeWidget::item:hover {{
     background-color: {COLORS['bg_hover']};
 }}
 
@@ -522,6 +631,34 @@ QRadioButton::indicator:checked {{
     border-color: {COLORS['primary']};
 }}
 
+/* Segmented radio buttons (graph layout picker) */
+QRadioButton[segment="true"] {{
+    color: {COLORS['text_secondary']};
+    spacing: 6px;
+    padding: 6px 12px;
+    background-color: {COLORS['bg_tertiary']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 6px;
+}}
+
+QRadioButton[segment="true"]::indicator {{
+    width: 12px;
+    height: 12px;
+    border-radius: 6px;
+    border: 2px solid {COLORS['border_light']};
+    background-color: transparent;
+}}
+
+QRadioButton[segment="true"]::indicator:checked {{
+    background-color: {COLORS['primary']};
+    border-color: {COLORS['primary']};
+}}
+
+QRadioButton[segment="true"]:hover {{
+    color: {COLORS['text_primary']};
+    border-color: {COLORS['primary']};
+}}
+
 /* Progress Bar */
 QProgressBar {{
     background-color: {COLORS['bg_tertiary']};
@@ -25,6 +25,12 @@
 #define API_MAX_REQUEST_SIZE 65536
 #define API_MAX_RESPONSE_SIZE 131072
 
+/** Marks a binary sim_tick frame (high bit set; never valid as JSON text) */
+#define API_TICK_FRAME 0x80
+#define API_TICK_AUTO_DETECT 0x01
+#define API_TICK_AUTO_RECOVER 0x02
+#define API_TICK_STATE_SIZE 28
+
 /* ============================================================================
  * Type Definitions
  * ============================================================================ */
@@ -56,6 +62,7 @@ typedef enum {
     CMD_ALLOCATE_RESOURCE,
     CMD_RELEASE_RESOURCE,
     CMD_RELEASE_ALL,
+    CMD_BULK_SETUP,
     
     /* Detection Operations */
     CMD_DETECT_DEADLOCK,
@@ -67,6 +74,7 @@ typedef enum {
     CMD_RECOVER,
     CMD_RECOMMEND_STRATEGY,
     CMD_ANALYZE_OPTIONS,
+    CMD_DETECT_AND_RECOVER,
     
     /* Simulation Operations */
     CMD_SIM_INIT,
@@ -84,6 +92,7 @@ typedef enum {
     CMD_GET_VERSION,
     CMD_GET_HELP,
     CMD_PING,
+    CMD_SET_TICK_MODE,
     CMD_SHUTDOWN,
     
     CMD_UNKNOWN
@@ -110,6 +119,8 @@ typedef struct {
     SimulationState simulation;     /**< Simulation state */
     bool initialized;               /**< Whether API is initialized */
     bool running;                   /**< Whether API server is running */
+    bool binary_ticks;              /**< Accept binary sim_tick frames on stdin */
+    int generation;                 /**< Bumped by every state-changing request */
     char last_error[256];           /**< Last error message */
 } APIContext;
 
@@ -134,6 +145,10 @@ typedef struct {
     int max_ticks;
     bool auto_detect;
     bool auto_recover;
+    char mode[16];                  /**< set_tick_mode: "binary" or "json" */
+    bool stream;                    /**< Stream the resulting state as records */
+    int request_id;                 /**< Client correlation id ("id") */
+    bool has_request_id;            /**< Whether the request carried an id */
 } APIRequest;
 
 /**
@@ -144,6 +159,10 @@ typedef struct {
     char message[256];              /**< Status message */
     char data[API_MAX_RESPONSE_SIZE]; /**< JSON data payload */
     int data_length;                /**< Length of data */
+    int generation;                 /**< State generation after the request */
+    bool stream_end;                /**< Final response of a streamed request */
+    int request_id;                 /**< Echoed client correlation id */
+    bool has_request_id;            /**< Whether to echo request_id */
 } APIResponse;
 
 /* ============================================================================
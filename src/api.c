@@ -10,6 +10,11 @@
 #include <stdarg.h>
 #include <ctype.h>
 
+#ifdef _WIN32
+#include <io.h>
+#include <fcntl.h>
+#endif
+
 /* ============================================================================
  * Command and Status Names
  * ============================================================================ */
@@ -36,6 +41,7 @@ static const CommandMapping command_map[] = {
     {"allocate_resource", CMD_ALLOCATE_RESOURCE},
     {"release_resource", CMD_RELEASE_RESOURCE},
     {"release_all", CMD_RELEASE_ALL},
+    {"bulk_setup", CMD_BULK_SETUP},
     {"detect_deadlock", CMD_DETECT_DEADLOCK},
     {"detect_all_cycles", CMD_DETECT_ALL_CYCLES},
     {"is_process_deadlocked", CMD_IS_PROCESS_DEADLOCKED},
@@ -43,6 +49,7 @@ static const CommandMapping command_map[] = {
     {"recover", CMD_RECOVER},
     {"recommend_strategy", CMD_RECOMMEND_STRATEGY},
     {"analyze_options", CMD_ANALYZE_OPTIONS},
+    {"detect_and_recover", CMD_DETECT_AND_RECOVER},
     {"sim_init", CMD_SIM_INIT},
     {"sim_load_scenario", CMD_SIM_LOAD_SCENARIO},
     {"sim_start", CMD_SIM_START},
@@ -56,6 +63,7 @@ static const CommandMapping command_map[] = {
     {"get_version", CMD_GET_VERSION},
     {"get_help", CMD_GET_HELP},
     {"ping", CMD_PING},
+    {"set_tick_mode", CMD_SET_TICK_MODE},
     {"shutdown", CMD_SHUTDOWN},
     {NULL, CMD_UNKNOWN}
 };
@@ -79,19 +87,36 @@ static const char* skip_whitespace(const char *s) {
     return s;
 }
 
+/*
+ * Find the value of key; returns the position of its first character.
+ * String literals are skipped whole, so a key name that appears inside a
+ * string value (e.g. a process named "id") is never mistaken for the key.
+ */
+static const char* find_value(const char *json, const char *key) {
+    size_t key_len = strlen(key);
+    const char *pos = json;
+    
+    while ((pos = strchr(pos, '"')) != NULL) {
+        const char *start = ++pos;
+        while (*pos && *pos != '"') {
+            if (*pos == '\\' && *(pos + 1)) pos++;
+            pos++;
+        }
+        if (!*pos) return NULL;
+        
+        bool match = (size_t)(pos - start) == key_len && strncmp(start, key, key_len) == 0;
+        pos = skip_whitespace(pos + 1);
+        if (match && *pos == ':') {
+            return skip_whitespace(pos + 1);
+        }
+    }
+    return NULL;
+}
+
 static bool extract_string(const char *json, const char *key, char *value, size_t value_size) {
-    char pattern[64];
-    snprintf(pattern, sizeof(pattern), "\"%s\"", key);
-    
-    const char *pos = strstr(json, pattern);
+    const char *pos = find_value(json, key);
     if (!pos) return false;
     
-    pos += strlen(pattern);
-    pos = skip_whitespace(pos);
-    if (*pos != ':') return false;
-    pos++;
-    pos = skip_whitespace(pos);
-    
     if (*pos != '"') return false;
     pos++;
     
@@ -108,18 +133,9 @@ static bool extract_string(const char *json, const char *key, char *value, size_
 }
 
 static bool extract_int(const char *json, const char *key, int *value) {
-    char pattern[64];
-    snprintf(pattern, sizeof(pattern), "\"%s\"", key);
-    
-    const char *pos = strstr(json, pattern);
+    const char *pos = find_value(json, key);
     if (!pos) return false;
     
-    pos += strlen(pattern);
-    pos = skip_whitespace(pos);
-    if (*pos != ':') return false;
-    pos++;
-    pos = skip_whitespace(pos);
-    
     char *end;
     long v = strtol(pos, &end, 10);
     if (end == pos) return false;
@@ -129,18 +145,9 @@ static bool extract_int(const char *json, const char *key, int *value) {
 }
 
 static bool extract_bool(const char *json, const char *key, bool *value) {
-    char pattern[64];
-    snprintf(pattern, sizeof(pattern), "\"%s\"", key);
-    
-    const char *pos = strstr(json, pattern);
+    const char *pos = find_value(json, key);
     if (!pos) return false;
     
-    pos += strlen(pattern);
-    pos = skip_whitespace(pos);
-    if (*pos != ':') return false;
-    pos++;
-    pos = skip_whitespace(pos);
-    
     if (strncmp(pos, "true", 4) == 0) {
         *value = true;
         return true;
@@ -152,6 +159,74 @@ static bool extract_bool(const char *json, const char *key, bool *value) {
     return false;
 }
 
+/* Find the array value of key; returns the position just past '[' */
+static const char* find_array(const char *json, const char *key) {
+    const char *pos = find_value(json, key);
+    if (!pos) return NULL;
+    
+    if (*pos != '[') return NULL;
+    return pos + 1;
+}
+
+/* Step to the next array element; returns NULL at the end of the array */
+static const char* next_element(const char *pos) {
+    pos = skip_whitespace(pos);
+    if (*pos == ',') pos = skip_whitespace(pos + 1);
+    if (*pos == ']' || *pos == '\0') return NULL;
+    return pos;
+}
+
+/* Return the position just past the JSON value starting at s */
+static const char* skip_value(const char *s) {
+    int depth = 0;
+    bool in_string = false;
+    
+    for (; *s; s++) {
+        if (in_string) {
+            if (*s == '\\' && *(s + 1)) {
+                s++;
+            } else if (*s == '"') {
+                in_string = false;
+            }
+        } else if (*s == '"') {
+            in_string = true;
+        } else if (*s == '{' || *s == '[') {
+            depth++;
+        } else if (*s == '}' || *s == ']') {
+            if (depth == 0) return s;
+            if (--depth == 0) return s + 1;
+        } else if (*s == ',' && depth == 0) {
+            return s;
+        }
+    }
+    return s;
+}
+
+/* Copy one array element into a NUL-terminated buffer (truncating) */
+static void copy_element(const char *start, const char *end, char *out, size_t out_size) {
+    size_t n = (size_t)(end - start);
+    if (n >= out_size) n = out_size - 1;
+    memcpy(out, start, n);
+    out[n] = '\0';
+}
+
+/* Parse a two-element integer array such as [1, 2] */
+static bool parse_int_pair(const char *s, int *first, int *second) {
+    s = skip_whitespace(s);
+    if (*s != '[') return false;
+    
+    char *end;
+    *first = (int)strtol(s + 1, &end, 10);
+    if (end == s + 1) return false;
+    
+    s = skip_whitespace(end);
+    if (*s != ',') return false;
+    s++;
+    
+    *second = (int)strtol(s, &end, 10);
+    return end != s;
+}
+
 /* ============================================================================
  * API Lifecycle Functions
  * ============================================================================ */
@@ -163,6 +238,8 @@ void api_init(APIContext *ctx) {
     simulation_init(&ctx->simulation);
     ctx->initialized = true;
     ctx->running = false;
+    ctx->binary_ticks = false;
+    ctx->generation = 0;
     ctx->last_error[0] = '\0';
 }
 
@@ -492,6 +569,9 @@ bool api_parse_request(const char *json, APIRequest *request) {
     extract_int(json, "max_ticks", &request->max_ticks);
     extract_bool(json, "auto_detect", &request->auto_detect);
     extract_bool(json, "auto_recover", &request->auto_recover);
+    extract_string(json, "mode", request->mode, sizeof(request->mode));
+    extract_bool(json, "stream", &request->stream);
+    request->has_request_id = extract_int(json, "id", &request->request_id);
     
     return true;
 }
@@ -500,6 +580,97 @@ bool api_parse_request(const char *json, APIRequest *request) {
  * Request Execution
  * ============================================================================ */
 
+/* Add request or assignment edges listed as [process_index, resource_index] */
+static bool api_bulk_edges(APIContext *ctx, const char *json, const char *key, bool allocate,
+                           const int *pids, int process_count,
+                           const int *rids, int resource_count, int *edge_count) {
+    for (const char *el = find_array(json, key); el && (el = next_element(el)); el = skip_value(el)) {
+        int p, r;
+        if (!parse_int_pair(el, &p, &r) ||
+            p < 0 || p >= process_count || r < 0 || r >= resource_count) {
+            return false;
+        }
+        bool ok = allocate ? rag_allocate_resource(&ctx->rag, pids[p], rids[r])
+                           : rag_request_resource(&ctx->rag, pids[p], rids[r]);
+        if (!ok) return false;
+        (*edge_count)++;
+    }
+    return true;
+}
+
+/*
+ * bulk_setup: {"processes": [{name, priority}...], "resources": [{name, instances}...],
+ *              "requests": [[p, r]...], "allocations": [[p, r]...]}
+ * Edge pairs index into the processes/resources arrays of the same request.
+ */
+static bool api_bulk_setup(APIContext *ctx, const char *json, APIResponse *response) {
+    int pids[MAX_PROCESSES];
+    int rids[MAX_RESOURCES];
+    int process_count = 0;
+    int resource_count = 0;
+    int edge_count = 0;
+    char item[256];
+    
+    for (const char *el = find_array(json, "processes"); el && (el = next_element(el)); el = skip_value(el)) {
+        char name[MAX_NAME_LENGTH] = "";
+        int priority = 0;
+        copy_element(el, skip_value(el), item, sizeof(item));
+        extract_string(item, "name", name, sizeof(name));
+        extract_int(item, "priority", &priority);
+        
+        int pid = process_count < MAX_PROCESSES ?
+                  rag_add_process(&ctx->rag, name[0] ? name : "Process", priority) : -1;
+        if (pid < 0) {
+            api_error_response(response, STATUS_OPERATION_FAILED, "Failed to add process");
+            return false;
+        }
+        pids[process_count++] = pid;
+    }
+    
+    for (const char *el = find_array(json, "resources"); el && (el = next_element(el)); el = skip_value(el)) {
+        char name[MAX_NAME_LENGTH] = "";
+        int instances = 1;
+        copy_element(el, skip_value(el), item, sizeof(item));
+        extract_string(item, "name", name, sizeof(name));
+        extract_int(item, "instances", &instances);
+        
+        int rid = resource_count < MAX_RESOURCES ?
+                  rag_add_resource(&ctx->rag, name[0] ? name : "Resource",
+                                   instances > 0 ? instances : 1) : -1;
+        if (rid < 0) {
+            api_error_response(response, STATUS_OPERATION_FAILED, "Failed to add resource");
+            return false;
+        }
+        rids[resource_count++] = rid;
+    }
+    
+    /* Assignments first so requests against held resources are valid */
+    if (!api_bulk_edges(ctx, json, "allocations", true, pids, process_count,
+                        rids, resource_count, &edge_count) ||
+        !api_bulk_edges(ctx, json, "requests", false, pids, process_count,
+                        rids, resource_count, &edge_count)) {
+        api_error_response(response, STATUS_OPERATION_FAILED, "Failed to add edge");
+        return false;
+    }
+    
+    api_success_response(response, "Bulk setup complete");
+    int written = snprintf(response->data, sizeof(response->data), "{\"process_ids\": [");
+    for (int i = 0; i < process_count; i++) {
+        written += snprintf(response->data + written, sizeof(response->data) - written,
+                            i > 0 ? ", %d" : "%d", pids[i]);
+    }
+    written += snprintf(response->data + written, sizeof(response->data) - written,
+                        "], \"resource_ids\": [");
+    for (int i = 0; i < resource_count; i++) {
+        written += snprintf(response->data + written, sizeof(response->data) - written,
+                            i > 0 ? ", %d" : "%d", rids[i]);
+    }
+    written += snprintf(response->data + written, sizeof(response->data) - written,
+                        "], \"edges\": %d}", edge_count);
+    response->data_length = written;
+    return true;
+}
+
 bool api_execute(APIContext *ctx, const APIRequest *request, APIResponse *response) {
     if (!ctx || !request || !response) return false;
     
@@ -654,6 +825,9 @@ bool api_execute(APIContext *ctx, const APIRequest *request, APIResponse *respon
                               "Failed to allocate (not available?)");
             return false;
             
+        case CMD_BULK_SETUP:
+            return api_bulk_setup(ctx, request->raw_json, response);
+            
         case CMD_RELEASE_RESOURCE:
             if (rag_release_resource(&ctx->rag, request->process_id, request->resource_id)) {
                 api_success_response(response, "Resource released");
@@ -737,6 +911,42 @@ bool api_execute(APIContext *ctx, const APIRequest *request, APIResponse *respon
             return true;
         }
             
+        case CMD_DETECT_AND_RECOVER: {
+            DeadlockResult detection;
+            detect_deadlock(&ctx->rag, &detection);
+            
+            int written = snprintf(response->data, sizeof(response->data), "{\"detection\": ");
+            written += api_deadlock_result_to_json(&ctx->rag, &detection, response->data + written,
+                                                   sizeof(response->data) - written);
+            
+            if (!detection.deadlock_detected) {
+                api_success_response(response, "No deadlock");
+                written += snprintf(response->data + written, sizeof(response->data) - written,
+                                    ", \"recovery\": null}");
+                response->data_length = written;
+                return true;
+            }
+            
+            RecoveryConfig config;
+            recovery_config_init(&config);
+            config.strategy = (RecoveryStrategy)request->strategy;
+            config.selection = (SelectionCriteria)request->criteria;
+            
+            RecoveryResult result;
+            if (recover_from_deadlock(&ctx->rag, &detection, &config, &result)) {
+                api_success_response(response, "Deadlock detected and recovered");
+            } else {
+                api_success_response(response, "Deadlock detected, recovery attempted");
+            }
+            written += snprintf(response->data + written, sizeof(response->data) - written,
+                                ", \"recovery\": ");
+            written += api_recovery_result_to_json(&result, response->data + written,
+                                                   sizeof(response->data) - written);
+            written += snprintf(response->data + written, sizeof(response->data) - written, "}");
+            response->data_length = written;
+            return true;
+        }
+            
         case CMD_RECOMMEND_STRATEGY: {
             DeadlockResult detection;
             detect_deadlock(&ctx->rag, &detection);
@@ -844,6 +1054,23 @@ bool api_execute(APIContext *ctx, const APIRequest *request, APIResponse *respon
             api_success_response(response, "pong");
             return true;
             
+        case CMD_SET_TICK_MODE:
+            if (strcmp(request->mode, "binary") == 0) {
+#ifdef _WIN32
+                /* Text-mode stdio would mangle 0x0A/0x1A bytes in tick frames */
+                _setmode(_fileno(stdin), _O_BINARY);
+                _setmode(_fileno(stdout), _O_BINARY);
+#endif
+                ctx->binary_ticks = true;
+            } else if (strcmp(request->mode, "json") == 0) {
+                ctx->binary_ticks = false;
+            } else {
+                api_error_response(response, STATUS_INVALID_PARAMS, "Invalid tick mode");
+                return false;
+            }
+            api_success_response(response, "Tick mode set");
+            return true;
+            
         case CMD_SHUTDOWN:
             ctx->running = false;
             api_success_response(response, "Shutting down");
@@ -866,6 +1093,17 @@ int api_serialize_response(const APIResponse *response, char *buffer, size_t buf
     int written = 0;
     /* Output compact single-line JSON for Python GUI compatibility */
     written += snprintf(buffer + written, buffer_size - written, "{");
+    if (response->has_request_id) {
+        /* Echo the client's id so pipelined requests can be correlated */
+        written += snprintf(buffer + written, buffer_size - written,
+            "\"id\": %d, ", response->request_id);
+    }
+    /* Lets clients cache read-only results until the state changes */
+    written += snprintf(buffer + written, buffer_size - written,
+        "\"gen\": %d, ", response->generation);
+    if (response->stream_end) {
+        written += snprintf(buffer + written, buffer_size - written, "\"end\": true, ");
+    }
     written += snprintf(buffer + written, buffer_size - written,
         "\"status\": \"%s\", ", api_status_name(response->status));
     written += snprintf(buffer + written, buffer_size - written,
@@ -881,6 +1119,76 @@ int api_serialize_response(const APIResponse *response, char *buffer, size_t buf
     return written;
 }
 
+static bool api_command_is_read_only(APICommand cmd) {
+    switch (cmd) {
+        case CMD_RAG_GET_STATE:
+        case CMD_LIST_PROCESSES:
+        case CMD_GET_PROCESS:
+        case CMD_LIST_RESOURCES:
+        case CMD_GET_RESOURCE:
+        case CMD_DETECT_DEADLOCK:
+        case CMD_DETECT_ALL_CYCLES:
+        case CMD_IS_PROCESS_DEADLOCKED:
+        case CMD_GET_WAIT_FOR_GRAPH:
+        case CMD_RECOMMEND_STRATEGY:
+        case CMD_ANALYZE_OPTIONS:
+        case CMD_SIM_GET_STATE:
+        case CMD_SIM_GET_EVENTS:
+        case CMD_GET_VERSION:
+        case CMD_GET_HELP:
+        case CMD_PING:
+        case CMD_SET_TICK_MODE:
+        case CMD_SHUTDOWN:
+        case CMD_UNKNOWN:
+            return true;
+        default:
+            return false;
+    }
+}
+
+/*
+ * Write the RAG as one line per process, resource, request and assignment,
+ * each tagged with the request id, ahead of the final response. Lets a
+ * client build its model from a single round trip.
+ */
+static void api_stream_rag_records(const RAG *rag, const APIResponse *response) {
+    char prefix[64];
+    char record[512];
+    
+    if (response->has_request_id) {
+        snprintf(prefix, sizeof(prefix), "{\"id\": %d, \"gen\": %d, ",
+                 response->request_id, response->generation);
+    } else {
+        snprintf(prefix, sizeof(prefix), "{\"gen\": %d, ", response->generation);
+    }
+    
+    for (int i = 0; i < MAX_PROCESSES; i++) {
+        if (rag->processes[i].active) {
+            api_process_to_json(&rag->processes[i], record, sizeof(record));
+            printf("%s\"record\": \"process\", \"data\": %s}\n", prefix, record);
+        }
+    }
+    for (int i = 0; i < MAX_RESOURCES; i++) {
+        if (rag->resources[i].active) {
+            api_resource_to_json(&rag->resources[i], record, sizeof(record));
+            printf("%s\"record\": \"resource\", \"data\": %s}\n", prefix, record);
+        }
+    }
+    for (int p = 0; p < MAX_PROCESSES; p++) {
+        for (int r = 0; r < MAX_RESOURCES; r++) {
+            if (rag->assignment_matrix[p][r] > 0) {
+                printf("%s\"record\": \"assignment\", \"data\": "
+                       "{\"process\": %d, \"resource\": %d, \"count\": %d}}\n",
+                       prefix, p, r, rag->assignment_matrix[p][r]);
+            }
+            if (rag->request_matrix[p][r] > 0) {
+                printf("%s\"record\": \"request\", \"data\": "
+                       "{\"process\": %d, \"resource\": %d}}\n", prefix, p, r);
+            }
+        }
+    }
+}
+
 int api_process_request(APIContext *ctx, const char *request_json,
                         char *response_buffer, size_t buffer_size) {
     if (!ctx || !request_json || !response_buffer || buffer_size == 0) return 0;
@@ -889,9 +1197,24 @@ int api_process_request(APIContext *ctx, const char *request_json,
     APIResponse response;
     
     if (!api_parse_request(request_json, &request)) {
+        memset(&response, 0, sizeof(APIResponse));
         api_error_response(&response, STATUS_INVALID_PARAMS, "Failed to parse request");
     } else {
         api_execute(ctx, &request, &response);
+        if (!api_command_is_read_only(request.command)) {
+            ctx->generation++;
+        }
+    }
+    
+    response.generation = ctx->generation;
+    response.has_request_id = request.has_request_id;
+    response.request_id = request.request_id;
+    
+    if (request.stream && request.command == CMD_SIM_LOAD_SCENARIO) {
+        if (response.status == STATUS_SUCCESS) {
+            api_stream_rag_records(&ctx->rag, &response);
+        }
+        response.stream_end = true;
     }
     
     return api_serialize_response(&response, response_buffer, buffer_size);
@@ -901,10 +1224,68 @@ int api_process_request(APIContext *ctx, const char *request_json,
  * Server Mode Functions
  * ============================================================================ */
 
+static void put_le32(unsigned char *out, int value) {
+    unsigned int v = (unsigned int)value;
+    out[0] = (unsigned char)(v & 0xFF);
+    out[1] = (unsigned char)((v >> 8) & 0xFF);
+    out[2] = (unsigned char)((v >> 16) & 0xFF);
+    out[3] = (unsigned char)((v >> 24) & 0xFF);
+}
+
+/**
+ * Run one simulation tick requested by a binary frame and reply in kind.
+ *
+ * Reply: API_TICK_FRAME, uint32 LE body length, then a fixed body of
+ * continued, running, paused, deadlock_occurred (one byte each) followed
+ * by scenario, current_tick, event_count, process_count, resource_count
+ * and the state generation (int32 LE each).
+ */
+static void api_process_binary_tick(APIContext *ctx, int flags) {
+    SimulationConfig config;
+    simulation_config_init(&config);
+    config.auto_detect = (flags & API_TICK_AUTO_DETECT) != 0;
+    config.auto_recover = (flags & API_TICK_AUTO_RECOVER) != 0;
+    
+    bool continued = simulation_tick(&ctx->simulation, &config);
+    /* Sync simulation RAG to main RAG for visualizer */
+    rag_copy(&ctx->rag, &ctx->simulation.rag);
+    ctx->generation++;
+    
+    const SimulationState *state = &ctx->simulation;
+    unsigned char frame[5 + API_TICK_STATE_SIZE];
+    frame[0] = API_TICK_FRAME;
+    put_le32(frame + 1, API_TICK_STATE_SIZE);
+    frame[5] = continued;
+    frame[6] = state->running;
+    frame[7] = state->paused;
+    frame[8] = state->deadlock_occurred;
+    put_le32(frame + 9, state->scenario);
+    put_le32(frame + 13, state->current_tick);
+    put_le32(frame + 17, state->event_count);
+    put_le32(frame + 21, state->rag.process_count);
+    put_le32(frame + 25, state->rag.resource_count);
+    put_le32(frame + 29, ctx->generation);
+    
+    fwrite(frame, 1, sizeof(frame), stdout);
+    fflush(stdout);
+}
+
 bool api_process_stdin(APIContext *ctx) {
     char request_buffer[API_MAX_REQUEST_SIZE];
     char response_buffer[API_MAX_RESPONSE_SIZE];
     
+    if (ctx->binary_ticks) {
+        int c = getchar();
+        if (c == EOF) {
+            return false;
+        }
+        if (c & API_TICK_FRAME) {
+            api_process_binary_tick(ctx, c);
+            return ctx->running;
+        }
+        ungetc(c, stdin);
+    }
+    
     if (!fgets(request_buffer, sizeof(request_buffer), stdin)) {
         return false; /* EOF or error */
     }
@@ -968,7 +1349,9 @@ const char* api_get_command_help(APICommand cmd) {
         case CMD_RELEASE_RESOURCE: return "Release resource: {process_id, resource_id}";
         case CMD_DETECT_DEADLOCK: return "Detect deadlock using DFS";
         case CMD_RECOVER: return "Recover from deadlock: {strategy, criteria}";
-        case CMD_SIM_LOAD_SCENARIO: return "Load simulation scenario: {scenario}";
+        case CMD_BULK_SETUP: return "Add processes, resources and edges: {processes, resources, requests, allocations}";
+        case CMD_DETECT_AND_RECOVER: return "Detect deadlock and recover in one step: {strategy, criteria}";
+        case CMD_SIM_LOAD_SCENARIO: return "Load simulation scenario: {scenario, stream}";
         case CMD_PING: return "Health check - returns 'pong'";
         case CMD_SHUTDOWN: return "Shutdown the API server";
         default: return "No help available";
@@ -987,9 +1370,10 @@ int api_get_documentation(char *buffer, size_t buffer_size) {
         "\"add_process\", \"remove_process\", \"list_processes\","
         "\"add_resource\", \"remove_resource\", \"list_resources\","
         "\"request_resource\", \"allocate_resource\", \"release_resource\","
-        "\"detect_deadlock\", \"recover\", \"recommend_strategy\","
+        "\"bulk_setup\", \"detect_deadlock\", \"recover\", \"detect_and_recover\","
+        "\"recommend_strategy\","
         "\"sim_init\", \"sim_load_scenario\", \"sim_start\", \"sim_tick\","
-        "\"ping\", \"shutdown\""
+        "\"ping\", \"set_tick_mode\", \"shutdown\""
         "]"
         "}",
         API_VERSION);
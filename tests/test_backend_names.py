@@ -0,0 +1,50 @@
+"""
+Round-trip tests for process names through the GUI backend interface
+
+Runs against the built backend (make); skipped when it is missing.
+Names are ones the control panel's name validator accepts, plus ones
+that imitate the request's own keys.
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'gui'))
+
+from backend_interface import BackendInterface, default_executable_path
+
+
+@unittest.skipUnless(os.path.exists(default_executable_path()), "backend not built")
+class ProcessNameRoundTripTest(unittest.TestCase):
+    """Names that look like JSON keys must not break request correlation"""
+
+    def setUp(self):
+        self.backend = BackendInterface()
+        self.backend.start()
+        self.addCleanup(self.backend.stop)
+
+    def _names(self):
+        response = self.backend.list_processes()
+        self.assertEqual(response['status'], 'success')
+        return [p['name'] for p in response['data']]
+
+    def test_names_accepted_by_validator(self):
+        names = ['id', 'id:', 'id 1', 'command', 'name']
+        for name in names:
+            response = self.backend.add_process(name, 10)
+            self.assertEqual(response['status'], 'success', name)
+        self.assertEqual(self._names(), names)
+
+    def test_quoted_name_keeps_request_id(self):
+        # The validator rejects quotes, but the reply must still reach its
+        # caller instead of timing out
+        response = self.backend.add_process('x"id":1', 10)
+        self.assertEqual(response['status'], 'success')
+        self.assertEqual(self.backend.ping()['status'], 'success')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+/**
+ * @file test_deadlock.c
+ * @brief Unit tests for the OS-EL deadlock module
+ */
+
+#include <stdio.h>
+#include <string.h>
+
+#include "../include/api.h"
+
+static int g_failures = 0;
+static int g_checks = 0;
+
+#define CHECK(cond) do { \
+    g_checks++; \
+    if (!(cond)) { \
+        g_failures++; \
+        fprintf(stderr, "%s:%d: check failed: %s\n", __FILE__, __LINE__, #cond); \
+    } \
+} while (0)
+
+/* ============================================================================
+ * Request Parsing
+ * ============================================================================ */
+
+/* Names that contain a key name must not hide the real key */
+static void test_parse_request_id_after_name(void) {
+    static const char *requests[] = {
+        "{\"command\": \"add_process\", \"name\": \"id\", \"priority\": 10, \"id\": 7}",
+        "{\"command\": \"add_process\", \"name\": \"x\\\"id\\\":1\", \"priority\": 10, \"id\": 7}",
+        "{\"command\": \"add_process\", \"name\": \"id:\", \"priority\": 10, \"id\": 7}",
+        "{\"id\": 7, \"command\": \"add_process\", \"name\": \"id\", \"priority\": 10}",
+    };
+    static const char *names[] = { "id", "x\"id\":1", "id:", "id" };
+
+    for (size_t i = 0; i < sizeof(requests) / sizeof(requests[0]); i++) {
+        static APIRequest request;
+        CHECK(api_parse_request(requests[i], &request));
+        CHECK(request.command == CMD_ADD_PROCESS);
+        CHECK(request.has_request_id);
+        CHECK(request.request_id == 7);
+        CHECK(request.priority == 10);
+        CHECK(strcmp(request.name, names[i]) == 0);
+    }
+}
+
+static void test_parse_command_named_like_key(void) {
+    static APIRequest request;
+    CHECK(api_parse_request("{\"name\": \"command\", \"command\": \"ping\"}", &request));
+    CHECK(request.command == CMD_PING);
+    CHECK(!request.has_request_id);
+}
+
+/* ============================================================================
+ * Request Round Trip
+ * ============================================================================ */
+
+/* The response to a named add_process echoes the request id */
+static void test_add_process_echoes_id(void) {
+    static APIContext ctx;
+    static char response[API_MAX_RESPONSE_SIZE];
+
+    api_init(&ctx);
+    api_process_request(&ctx,
+        "{\"command\": \"add_process\", \"name\": \"id\", \"priority\": 10, \"id\": 42}",
+        response, sizeof(response));
+    CHECK(strncmp(response, "{\"id\": 42, ", 11) == 0);
+    CHECK(strstr(response, "\"success\"") != NULL);
+    api_destroy(&ctx);
+}
+
+/* ============================================================================
+ * Main
+ * ============================================================================ */
+
+int main(void) {
+    test_parse_request_id_after_name();
+    test_parse_command_named_like_key();
+    test_add_process_echoes_id();
+
+    printf("%d checks, %d failures\n", g_checks, g_failures);
+    return g_failures == 0 ? 0 : 1;
+}